@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module runs the simulation of an affection and friendship
+social network without any interaction with kernel.batch, taking
+its parameters from the command line or from a JSON config file.
+Run it with --help to see every option.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+import sys
+
+import network # Puts the kernel in the path of modules.
+import kernel.batch as engine
+from kernel.rules import friend_rules as rules
+
+#-----------------------------------------------------------#
+
+"""
+Description of the script in its help.
+"""
+description = "Simulation of social networks of lovers and friends."
+
+#-----------------------------------------------------------#
+
+def main(argv = None):
+    """
+    Runs a whole simulation with the given options (see kernel.batch.main).
+
+    @param argv: List of command line arguments. Uses sys.argv if None.
+    """
+    return engine.main(rules, description, argv)
+
+#-----------------------------------------------------------#
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
+
+#-----------------------------------------------------------#
+
+###### EOF: batch.py ########################################
@@ -11,7 +11,7 @@ Last updated: 28/March/2018
 #-----------------------------------------------------------#
 
 import igraph
-from numpy.random import randint as ri
+import numpy as np
 
 import plotly.offline as py
 from plotly.graph_objs import *
@@ -53,7 +53,7 @@ def getNodesCoordinates(network, layout):
     coord_fem = [[], [], []]
 
     for v in network.people:
-        k = network.people.index(v)
+        k = v.ident
         
         if v.attributes['sex'] == 0:
             coord_male[0].append(layout[k][0])
@@ -172,27 +172,32 @@ def plotNetwork(network, plot_title, width = 1000, height = 1000):
 
 #-----------------------------------------------------------#
 
-def plotCommunities(communities, title, width = 1000, height = 1000, layer_offset = 200):
+def plotCommunities(communities, population, title, width = 1000, height = 1000, layer_offset = 200, rng = None):
     """
     Plots in the same 3D scene all the communities of a graph.
 
-    @param communities: Iterable object containing the subgraphs of a graph.
+    @param communities: Communities object of a graph (see analysis.getCommunities).
+    @param population: Population of the network whose graph was divided.
     @param title: Title of the plot.
     @param width: Width in pixels of the plot.
     @param height: Height in pixels of the plot.
     @param layer_offset: Offset in pixels for each layer of the plot. Each subgraph gets its own layer.
+    @param rng: numpy.random.Generator used to pick the colors. A new one is used if None.
     """
     data = []
 
-    colors = ['#%02X%02X%02X' % (ri(0, 256), ri(0, 256), ri(0, 256))
+    if rng is None:
+        rng = np.random.default_rng()
+    colors = ['#%02X%02X%02X' % tuple(rng.integers(0, 256, 3))
               for sub in range(len(communities))]
 
     for sub, color, layer in zip(communities, colors, range(len(communities))):
         # We get the labels.
-        labels = [n['info'].name + ', ' +
-                  str(n['info'].attributes['age']) + ', ' +
-                  active_attr['orientation'][n['info'].attributes['orientation']]
-                  for n in sub.vs]
+        people = [population[ident] for ident in sub.values('ident')]
+        labels = [person.name + ', ' +
+                  str(person.attributes['age']) + ', ' +
+                  active_attr['orientation'][person.attributes['orientation']]
+                  for person in people]
 
         # We get the layout and make the data for the scatters.
         layout = sub.layout('kk_3d')
@@ -207,9 +212,7 @@ def plotCommunities(communities, title, width = 1000, height = 1000, layer_offse
         edges_y = []
         edges_z = []
 
-        for e in sub.es:
-            e_v = e.tuple
-
+        for e_v in sub.edges().tolist():
             edges_x += [layout[e_v[0]][0], layout[e_v[1]][0], None]
             edges_y += [layout[e_v[0]][1], layout[e_v[1]][1], None]
             
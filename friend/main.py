@@ -53,10 +53,14 @@ print(network)
 print(len(network.in_relation))
 draw.plotNetwork(network, "Final network after " + str(generations) + " generations of relationships")
 
-for algo, title in zip(('between', 'map', 'label'), ('Edge-betweenness', 'Infomap', 'Label propagation')):
-    print('Finding community structure using ' + title + '.')
-    communities = analysis.getCommunities(network.graph, algo)
-    draw.plotCommunities(communities, title)
+titles = ('Automatic choice', 'Infomap', 'Label propagation')
+print('Finding community structure using ' + ', '.join(titles) + ' at once.')
+results = analysis.compareCommunities(network.graph, ('auto', 'map', 'label'))
+
+for title, (communities, report) in zip(titles, results):
+    print(title + ' used ' + report['algorithm'] + ' for ' + '%.3f' % report['runtime'] +
+          ' seconds, modularity ' + '%.4f' % report['modularity'] + '.')
+    draw.plotCommunities(communities, network.people, title)
     continue_test = input('Continue with the next algorithm?')
 
 #-----------------------------------------------------------#
@@ -0,0 +1,24 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This package binds the simulation kernel to the rules of an
+affection and friendship social network.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+import os
+import sys
+
+# The kernel lives in the root of the repository, next to this package.
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if root not in sys.path:
+    sys.path.insert(0, root)
+del root
+
+#-----------------------------------------------------------#
+
+###### EOF: __init__.py #####################################
@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module sweeps the parameters of the simulation of an
+affection and friendship social network with kernel.sweep.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+import kernel.sweep as engine
+from kernel.sweep import *
+from kernel.rules import friend_rules as rules
+
+#-----------------------------------------------------------#
+
+def makeParams(point):
+    """
+    Returns the parameters for a point of a grid (see kernel.sweep.makeParams).
+    """
+    return engine.makeParams(rules, point)
+
+#-----------------------------------------------------------#
+
+def runSweep(*args, **kwargs):
+    """
+    Runs the replicas of every point of a grid (see kernel.sweep.runSweep).
+    """
+    return engine.runSweep(rules, *args, **kwargs)
+
+#-----------------------------------------------------------#
+
+def main(argv = None):
+    """
+    Runs the sweep asked for in the command line (see kernel.sweep.main).
+    """
+    return engine.main(rules, argv)
+
+#-----------------------------------------------------------#
+
+###### EOF: sweep.py ########################################
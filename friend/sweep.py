@@ -0,0 +1,29 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module runs the simulation of an affection and friendship
+social network for every point of a grid of parameters with
+kernel.sweep. The grid is a JSON file with an object from the
+names of the parameters to lists of values, as in
+{"sample_pool": [10, 20], "offsets.ex": [0.5, 0.7]}.
+Finished points are cached, so an interrupted sweep can be
+run again to finish it.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+import sys
+
+import network.sweep as sweep
+
+#-----------------------------------------------------------#
+
+if __name__ == '__main__':
+    sweep.main(sys.argv[1:])
+
+#-----------------------------------------------------------#
+
+###### EOF: sweep.py ########################################
@@ -0,0 +1,301 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module keeps the edges of a social network in sparse
+arrays, and builds an igraph Graph from them only when it's
+needed.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+from collections import Counter
+
+import numpy as np
+import igraph
+
+#-----------------------------------------------------------#
+
+class SparseAdjacency:
+    """
+    This class defines the undirected edges of a graph with a
+    fixed number of vertices, stored in compressed sparse rows
+    (CSR) plus a buffer of the changes made since the rows were
+    last built. Every edge has a boolean attribute, and edges are
+    told apart by their endpoints and the value of that attribute.
+    There may be many edges with the same endpoints and value, but
+    no loops. Keeps count of how many edges have each value of the
+    attribute, and tells every edge added or deleted to a watcher
+    with addEdge and deleteEdge methods, if it has one.
+    """
+
+    def __init__(self, size, attribute, compact_ratio = 0.25):
+        """
+        Creates a graph with size vertices and no edges.
+
+        @param size: Number of vertices.
+        @param attribute: Name of the boolean attribute of the edges.
+        @param compact_ratio: The changes are merged into the rows when
+                              there are more than this fraction of the
+                              edges in the buffer.
+        """
+        self.size = size
+        self.attribute = attribute
+        self.compact_ratio = compact_ratio
+
+        # Row u has the neighbours of u in indices[indptr[u]:indptr[u+1]],
+        # sorted by neighbour and value, so every edge is there twice.
+        self.indptr = np.zeros(size + 1, dtype = np.int64)
+        self.indices = np.zeros(0, dtype = np.int64)
+        self.values = np.zeros(0, dtype = bool)
+
+        # Changes to the rows, counted by key (see edgeKey).
+        self.added = Counter()
+        self.deleted = Counter()
+
+        self.counts = {True: 0, False: 0}
+        self.version = 0 # Changes every time an edge changes.
+
+        # Object told about every edge added or deleted. Edges set
+        # with setEdges aren't told.
+        self.watcher = None
+
+    def __len__(self):
+        """
+        Returns the number of edges.
+        """
+        return self.counts[True] + self.counts[False]
+
+    def edgeKey(self, u, v, value):
+        """
+        Returns the integer that identifies the edges between u
+        and v with the given value.
+
+        @param u: Index of a vertex.
+        @param v: Index of a vertex.
+        @param value: Value of the attribute of the edge.
+        """
+        u, v = min(u, v), max(u, v)
+        return (u * self.size + v) * 2 + int(value)
+
+    def rowMultiplicity(self, u, v, value):
+        """
+        Returns the number of edges between u and v with the given
+        value in the rows, without the buffered changes.
+
+        @param u: Index of a vertex.
+        @param v: Index of a vertex.
+        @param value: Value of the attribute of the edge.
+        """
+        start, end = self.indptr[u], self.indptr[u + 1]
+        row = self.indices[start:end] * 2 + self.values[start:end]
+        key = v * 2 + int(value)
+        return int(np.searchsorted(row, key, 'right') - np.searchsorted(row, key, 'left'))
+
+    def multiplicity(self, u, v, value):
+        """
+        Returns the number of edges between u and v with the given value.
+
+        @param u: Index of a vertex.
+        @param v: Index of a vertex.
+        @param value: Value of the attribute of the edge.
+        """
+        key = self.edgeKey(u, v, value)
+        return self.rowMultiplicity(u, v, value) + self.added[key] - self.deleted[key]
+
+    def hasEdge(self, u, v, value):
+        """
+        Returns whether or not there is an edge between u and v
+        with the given value.
+
+        @param u: Index of a vertex.
+        @param v: Index of a vertex.
+        @param value: Value of the attribute of the edge.
+        """
+        return self.multiplicity(u, v, value) > 0
+
+    def neighbors(self, u, value = None):
+        """
+        Returns a sorted array with the neighbours of u, once for
+        every edge between them.
+
+        @param u: Index of a vertex.
+        @param value: Only edges with this value are counted if not None.
+        """
+        self.compact()
+
+        start, end = self.indptr[u], self.indptr[u + 1]
+        neighbors = self.indices[start:end]
+        if value is not None:
+            neighbors = neighbors[self.values[start:end] == value]
+
+        return neighbors
+
+    def addEdge(self, u, v, value):
+        """
+        Adds an edge between u and v.
+
+        @param u: Index of a vertex.
+        @param v: Index of a vertex.
+        @param value: Value of the attribute of the edge.
+        """
+        if u == v:
+            raise ValueError("Loops aren't allowed!")
+
+        key = self.edgeKey(u, v, value)
+
+        # Adding back a deleted edge just cancels its deletion.
+        if self.deleted[key] > 0:
+            self.deleted[key] -= 1
+            if self.deleted[key] == 0:
+                del self.deleted[key]
+        else:
+            self.added[key] += 1
+
+        self.counts[bool(value)] += 1
+        self.version += 1
+
+        if self.watcher is not None:
+            self.watcher.addEdge(u, v, value)
+
+    def deleteEdge(self, u, v, value):
+        """
+        Deletes an edge between u and v.
+
+        @param u: Index of a vertex.
+        @param v: Index of a vertex.
+        @param value: Value of the attribute of the edge.
+        """
+        key = self.edgeKey(u, v, value)
+
+        if self.added[key] > 0:
+            self.added[key] -= 1
+            if self.added[key] == 0:
+                del self.added[key]
+        elif self.deleted[key] < self.rowMultiplicity(u, v, value):
+            self.deleted[key] += 1
+        else:
+            raise ValueError("There is no edge between " + str(u) + " and " + str(v) + "!")
+
+        self.counts[bool(value)] -= 1
+        self.version += 1
+
+        if self.watcher is not None:
+            self.watcher.deleteEdge(u, v, value)
+
+    def changeEdge(self, u, v, old, new):
+        """
+        Changes the attribute of an edge between u and v.
+
+        @param u: Index of a vertex.
+        @param v: Index of a vertex.
+        @param old: Current value of the attribute of the edge.
+        @param new: New value of the attribute of the edge.
+        """
+        self.deleteEdge(u, v, old)
+        self.addEdge(u, v, new)
+
+    def edgeKeys(self):
+        """
+        Returns a sorted array with the key of every edge,
+        buffered changes included.
+        """
+        # Each edge is in the rows of both of its vertices.
+        rows = np.repeat(np.arange(self.size), np.diff(self.indptr))
+        lower = rows < self.indices
+        keys = (rows[lower] * self.size + self.indices[lower]) * 2 + self.values[lower]
+
+        deleted = sorted(self.deleted)
+        if deleted:
+            deleted_keys = np.array(deleted, dtype = np.int64)
+            times = np.array([self.deleted[key] for key in deleted], dtype = np.int64)
+
+            # Repeated keys are next to each other, so we delete the
+            # first times copies of each deleted key.
+            first = np.repeat(np.searchsorted(keys, deleted_keys), times)
+            offsets = np.arange(times.sum()) - np.repeat(np.cumsum(times) - times, times)
+            keys = np.delete(keys, first + offsets)
+
+        added = list(self.added)
+        if added:
+            keys = np.concatenate((keys, np.repeat(np.array(added, dtype = np.int64),
+                                                   [self.added[key] for key in added])))
+            keys.sort()
+
+        return keys
+
+    def edgeList(self):
+        """
+        Returns an array of shape (edges, 2) with the endpoints of
+        every edge, and an array with the value of each one.
+        """
+        keys = self.edgeKeys()
+        pairs = keys // 2
+        return np.column_stack((pairs // self.size, pairs % self.size)), (keys % 2).astype(bool)
+
+    def compact(self):
+        """
+        Merges the buffered changes into the rows.
+        """
+        if not self.added and not self.deleted:
+            return
+
+        # The edges stay the same, so the version doesn't change.
+        version = self.version
+        self.setEdges(*self.edgeList())
+        self.version = version
+
+    def setEdges(self, pairs, values):
+        """
+        Replaces every edge with the given ones.
+
+        @param pairs: Array of shape (edges, 2) with the endpoints of every edge.
+        @param values: Array with the value of the attribute of every edge.
+        """
+        pairs = np.asarray(pairs, dtype = np.int64).reshape(-1, 2)
+        values = np.asarray(values, dtype = bool)
+        if np.any(pairs[:, 0] == pairs[:, 1]):
+            raise ValueError("Loops aren't allowed!")
+
+        rows = np.concatenate((pairs[:, 0], pairs[:, 1]))
+        cols = np.concatenate((pairs[:, 1], pairs[:, 0]))
+        both_values = np.concatenate((values, values))
+
+        order = np.lexsort((both_values, cols, rows))
+        self.indices = cols[order]
+        self.values = both_values[order]
+        self.indptr = np.concatenate(([0], np.cumsum(np.bincount(rows, minlength = self.size))))
+
+        self.added.clear()
+        self.deleted.clear()
+
+        self.counts = {True: int(np.count_nonzero(values)), False: int(np.count_nonzero(~values))}
+        self.version += 1
+
+    def flush(self):
+        """
+        Merges the buffered changes into the rows if there are
+        too many of them.
+        """
+        changes = sum(self.added.values()) + sum(self.deleted.values())
+        if changes > self.compact_ratio * len(self.indices) // 2:
+            self.compact()
+
+    def toGraph(self):
+        """
+        Returns an igraph Graph with the same edges. Every vertex
+        has the index of its person as 'ident' attribute.
+        """
+        pairs, values = self.edgeList()
+
+        graph = igraph.Graph(n = self.size, edges = pairs.tolist())
+        graph.vs['ident'] = list(range(self.size))
+        graph.es[self.attribute] = values.tolist()
+
+        return graph
+
+#-----------------------------------------------------------#
+
+###### EOF: adjacency.py ####################################
@@ -0,0 +1,299 @@
+"""
+This module uses graph algorithms to assess community structure
+and other things.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+import math
+import time
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import igraph
+
+#-----------------------------------------------------------#
+
+class CommunityView:
+    """
+    This class defines a view of a community of a graph that
+    indexes into the graph instead of copying it. A copy of the
+    community as a graph is only made when it's asked for.
+    """
+
+    __slots__ = ('communities', 'index')
+
+    def __init__(self, communities, index):
+        """
+        Creates a view of a community.
+
+        @param communities: Communities object the community belongs to.
+        @param index: Number of the community.
+        """
+        self.communities = communities
+        self.index = index
+
+    def __len__(self):
+        return int(self.communities.sizes[self.index])
+
+    def vertices(self):
+        """
+        Returns a sorted array with the vertices of the graph
+        in this community.
+        """
+        return self.communities.members(self.index)
+
+    def edges(self):
+        """
+        Returns an array of shape (edges, 2) with the edges of the
+        graph inside this community, as positions in vertices().
+        """
+        return np.searchsorted(self.vertices(), self.communities.innerEdges(self.index))
+
+    def values(self, attribute):
+        """
+        Returns a list with an attribute of every vertex of this community.
+
+        @param attribute: Name of the attribute of the vertices.
+        """
+        return self.communities.graph.vs.select(self.vertices().tolist())[attribute]
+
+    def layout(self, algorithm = 'kk'):
+        """
+        Returns the layout of the vertices and edges of this community,
+        in the same order as vertices().
+
+        @param algorithm: Name of an igraph layout algorithm.
+        """
+        return igraph.Graph(n = len(self), edges = self.edges().tolist()).layout(algorithm)
+
+    def subgraph(self):
+        """
+        Returns a copy of this community as an igraph Graph, with
+        every attribute of its vertices and edges.
+        """
+        return self.communities.graph.induced_subgraph(self.vertices().tolist())
+
+#-----------------------------------------------------------#
+
+class Communities(Sequence):
+    """
+    This class defines the community structure of a graph as the
+    community of every vertex. Each community is a CommunityView,
+    a slice is a list of them, and the arrays needed to index them
+    are only made once the first one is asked for.
+    """
+
+    def __init__(self, graph, membership):
+        """
+        Creates the community structure of a graph.
+
+        @param graph: igraph Graph object that was divided.
+        @param membership: Community of every vertex of graph, numbered from 0.
+        """
+        self.graph = graph
+        self.membership = np.asarray(membership, dtype = np.int64)
+        self.sizes = np.bincount(self.membership)
+        self.starts = np.concatenate(([0], np.cumsum(self.sizes)))
+
+        # Vertices and inner edges sorted by community, made when needed.
+        self.order = None
+        self.inner = None
+        self.inner_starts = None
+
+    def __len__(self):
+        return len(self.sizes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [CommunityView(self, k) for k in range(*index.indices(len(self)))]
+        if not -len(self) <= index < len(self):
+            raise IndexError("Community out of range!")
+        return CommunityView(self, index % len(self))
+
+    def members(self, index):
+        """
+        Returns a sorted array with the vertices of a community.
+
+        @param index: Number of the community.
+        """
+        if self.order is None:
+            self.order = np.argsort(self.membership, kind = 'stable')
+        return self.order[self.starts[index]:self.starts[index + 1]]
+
+    def innerEdges(self, index):
+        """
+        Returns an array of shape (edges, 2) with the edges of the
+        graph whose ends are both in a community.
+
+        @param index: Number of the community.
+        """
+        if self.inner is None:
+            edges = np.array(self.graph.get_edgelist(), dtype = np.int64).reshape(-1, 2)
+            edges = edges[self.membership[edges[:, 0]] == self.membership[edges[:, 1]]]
+            labels = self.membership[edges[:, 0]]
+            self.inner = edges[np.argsort(labels, kind = 'stable')]
+            self.inner_starts = np.concatenate(([0], np.cumsum(np.bincount(labels, minlength = len(self)))))
+        return self.inner[self.inner_starts[index]:self.inner_starts[index + 1]]
+
+#-----------------------------------------------------------#
+
+def fastGreedy(graph):
+    """
+    Runs the fast greedy algorithm on graph. It only works without
+    multi-edges, so parallel edges are merged into a single one
+    weighted by how many they were, which keeps the modularity.
+
+    @param graph: igraph Graph object to be analyzed.
+    """
+    simple = graph.copy()
+    simple.es['weight'] = 1
+    simple.simplify(combine_edges = {'weight':'sum'})
+    return simple.community_fastgreedy(weights = 'weight').as_clustering()
+
+#-----------------------------------------------------------#
+
+"""
+Community detection algorithms, by their name in getCommunities.
+"""
+algorithms = {'between':lambda graph: graph.community_edge_betweenness(directed = False).as_clustering(),
+              'map':lambda graph: graph.community_infomap(),
+              'label':lambda graph: graph.community_label_propagation(),
+              'multilevel':lambda graph: graph.community_multilevel(),
+              'leiden':lambda graph: graph.community_leiden(objective_function = 'modularity'),
+              'greedy':fastGreedy}
+
+"""
+Rough runtime in seconds of each algorithm on a graph with n vertices
+and m edges, measured on a single core on the networks of both rule
+sets after 40 generations, from 1,000 to 50,000 people, and rounded
+up to the slowest of them. Edge betweenness is O(m²n), so it is only
+meant for small graphs.
+"""
+runtime_models = {'between':lambda n, m: 3e-8 * m * m * n,
+                  'map':lambda n, m: 1e-4 * m * math.log2(n + 2),
+                  'label':lambda n, m: 1e-5 * m * math.log2(n + 2),
+                  'multilevel':lambda n, m: 3e-6 * m * math.log2(n + 2),
+                  'leiden':lambda n, m: 5e-7 * m * math.log2(n + 2),
+                  'greedy':lambda n, m: 6e-6 * m * math.log2(n + 2)}
+
+"""
+Algorithms tried by the 'auto' option, from the one that reaches the
+highest modularity. On the networks runtime_models was measured on,
+Leiden reached the highest modularity and was also the fastest, so
+no other algorithm would ever be tried after it.
+"""
+auto_order = ('leiden',)
+
+#-----------------------------------------------------------#
+
+def chooseAlgorithm(graph, budget = 60):
+    """
+    Returns the first algorithm of auto_order whose estimated
+    runtime on graph fits in a budget or, if none does, the
+    algorithm with the lowest estimated runtime.
+
+    @param graph: igraph Graph object to be analyzed.
+    @param budget: Seconds the community detection may take.
+    """
+    n, m = graph.vcount(), graph.ecount()
+    for algorithm in auto_order:
+        if runtime_models[algorithm](n, m) <= budget:
+            return algorithm
+
+    return min(runtime_models, key = lambda algorithm: runtime_models[algorithm](n, m))
+
+#-----------------------------------------------------------#
+
+def runAlgorithm(graph, algorithm):
+    """
+    Runs a community detection algorithm on graph. Returns the
+    community of every vertex and a dictionary with the algorithm,
+    its runtime in seconds and the modularity it reached.
+
+    @param graph: igraph Graph object to be analyzed.
+    @param algorithm: Key of algorithms.
+    """
+    start = time.perf_counter()
+    clusters = algorithms[algorithm](graph)
+    runtime = time.perf_counter() - start
+
+    report = {'algorithm':algorithm, 'runtime':runtime,
+              'modularity':graph.modularity(clusters.membership)}
+
+    return clusters.membership, report
+
+#-----------------------------------------------------------#
+
+def runOnEdges(size, edges, algorithm):
+    """
+    Runs a community detection algorithm on the graph with size
+    vertices and the given edges (see runAlgorithm). Used by the
+    processes of compareCommunities, which only get the edges.
+
+    @param size: Number of vertices.
+    @param edges: Array of shape (edges, 2) with the vertices of each edge.
+    @param algorithm: Key of algorithms.
+    """
+    return runAlgorithm(igraph.Graph(n = size, edges = edges.tolist()), algorithm)
+
+#-----------------------------------------------------------#
+
+def getCommunities(graph, algorithm = 'auto', budget = 60):
+    """
+    Gets the community structure of a given network. Returns a
+    Communities object and a dictionary with the algorithm used,
+    its runtime in seconds and the modularity it reached.
+
+    @param graph: igraph Graph object to be analyzed.
+    @param algorithm: Algorithm to be used. Options are:
+                      * 'auto': Chosen by chooseAlgorithm
+                      * 'leiden': Leiden
+                      * 'multilevel': Multilevel (Louvain)
+                      * 'greedy': Fast greedy
+                      * 'label': Labels propagation
+                      * 'map': Map of random walks
+                      * 'between': Edge betweenness, only for small graphs
+    @param budget: Seconds the community detection may take with 'auto'.
+    """
+    if algorithm == 'auto':
+        algorithm = chooseAlgorithm(graph, budget)
+    elif algorithm not in algorithms:
+        raise ValueError("Invalid option!")
+
+    membership, report = runAlgorithm(graph, algorithm)
+    return Communities(graph, membership), report
+
+#-----------------------------------------------------------#
+
+def compareCommunities(graph, names = ('auto', 'map', 'label'), budget = 60, workers = None):
+    """
+    Gets the community structure of a given network with several
+    algorithms at once, each one in its own process, which only
+    gets the edges of graph instead of the whole graph. Returns a
+    list with the result of getCommunities for every algorithm.
+
+    @param graph: igraph Graph object to be analyzed.
+    @param names: Algorithms to be used (see getCommunities).
+    @param budget: Seconds the community detection may take with 'auto'.
+    @param workers: Number of processes. One for each algorithm if None.
+    """
+    chosen = [chooseAlgorithm(graph, budget) if name == 'auto' else name for name in names]
+    if not set(chosen) <= set(algorithms):
+        raise ValueError("Invalid option!")
+
+    edges = np.array(graph.get_edgelist(), dtype = np.int32).reshape(-1, 2)
+
+    with ProcessPoolExecutor(max_workers = workers or len(chosen)) as pool:
+        runs = [pool.submit(runOnEdges, graph.vcount(), edges, algorithm) for algorithm in chosen]
+        results = [run.result() for run in runs]
+
+    return [(Communities(graph, membership), report) for (membership, report) in results]
+
+#-----------------------------------------------------------#
+
+###### EOF: analysis.py #####################################
@@ -0,0 +1,314 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module runs the simulation of a social network without
+any interaction, taking its parameters from the command line
+or from a JSON config file whose keys are the names of the
+options (with underscores instead of dashes). The batch.py
+script of each package runs it with its own rule set.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+import os
+import json
+import argparse
+
+import numpy as np
+
+import kernel.people as people
+import kernel.network as nw
+import kernel.simulation as sim
+import kernel.seeding as seeding
+import kernel.ensemble as ensemble
+import kernel.checkpoint as checkpoint
+import kernel.events as events
+import kernel.replay as replay
+import kernel.tracking as tracking
+import kernel.metrics as metrics
+
+#-----------------------------------------------------------#
+
+"""
+Help of the option of every simulation parameter a rule set may
+have. Parameters are options named after them, with dashes
+instead of underscores, whose type comes from their default value.
+"""
+param_help = {'sample_pool':"Singles sampled for dates in each generation.",
+              'pos_pool':"Dates of each sampled single.",
+              'offsets':"JSON object with the probability offsets to change (see network.default_offsets).",
+              'batched':"Evaluate all the dates of a generation at once.",
+              'sample_size':"People sampled to make friends in each generation.",
+              'pos_size':"Possible friends of each sampled person.",
+              'friend_limit':"Most friends a person can have."}
+
+"""
+Options of a single run, which replicas don't have. They are off
+when they are None, 'none' or 0.
+"""
+single_run_options = ('plot', 'checkpoint', 'events', 'keyframe_step', 'track', 'metrics', 'resume')
+
+#-----------------------------------------------------------#
+
+def makeParser(rules, description):
+    """
+    Returns the parser of the command line options.
+
+    @param rules: RuleSet object (see kernel.rules).
+    @param description: Description of the script.
+    """
+    parser = argparse.ArgumentParser(description = description)
+
+    parser.add_argument('--config', help = "JSON file with default values for the options.")
+    parser.add_argument('--names', default = 'names.txt', help = "Path of a database of names and sexes.")
+    parser.add_argument('--source', choices = ('file', 'stream', 'replace', 'synthetic'), default = 'file',
+                        help = "Where the names come from: the whole file, a single pass over it, "
+                               "a sample with replacement, or made up names.")
+    parser.add_argument('--size', type = int, default = 100, help = "Number of people in the network.")
+    parser.add_argument('--generations', type = int, default = 100, help = "Number of generations to simulate.")
+    parser.add_argument('--seed', type = int, help = "Seed of the random numbers, for reproducible runs.")
+
+    for (name, default) in rules.default_params.items():
+        option = '--' + name.replace('_', '-')
+        if isinstance(default, bool):
+            parser.add_argument(option, action = 'store_true', default = default, help = param_help[name])
+        elif isinstance(default, dict):
+            parser.add_argument(option, type = json.loads, default = default, help = param_help[name])
+        else:
+            parser.add_argument(option, type = type(default), default = default, help = param_help[name])
+
+    parser.add_argument('--plot', choices = ('none', 'final', 'step'), default = 'none',
+                        help = "Plot nothing, only the final network, or the network every step generations.")
+    parser.add_argument('--step', type = int, default = 1,
+                        help = "Generations between printed counters and plots.")
+    parser.add_argument('--counters', help = "CSV file where the counters of every generation are written.")
+    parser.add_argument('--quiet', action = 'store_true', help = "Don't print the counters.")
+
+    parser.add_argument('--checkpoint', help = "File (.npz) where the state of the simulation is saved "
+                                               "every checkpoint step generations and at the end.")
+    parser.add_argument('--checkpoint-step', type = int, default = 100,
+                        help = "Generations between checkpoints.")
+    parser.add_argument('--events', help = "Directory of a log where every relationship made or broken is written. "
+                                           "A resumed simulation drops the events after its checkpoint.")
+    parser.add_argument('--keyframe-step', type = int, default = 0,
+                        help = "Generations between keyframes saved next to the event log, from which "
+                               "network.replay rebuilds any generation. 0 disables them.")
+    parser.add_argument('--track', help = "File (.npz) where the communities found every track step generations "
+                                          "are saved, along with their births, deaths, merges and splits.")
+    parser.add_argument('--track-step', type = int, default = 10,
+                        help = "Generations between tracked communities.")
+    parser.add_argument('--track-algorithm', choices = ('leiden', 'label'), default = 'leiden',
+                        help = "Algorithm of the tracked communities, seeded with the previous ones.")
+    parser.add_argument('--metrics', help = "File (.npz) where a table with the degrees, transitivity, components, "
+                                            "ratio of edges and singles of every generation is saved.")
+    parser.add_argument('--metrics-step', type = int, default = 10,
+                        help = "Generations between recomputed components once relationships are lost.")
+    parser.add_argument('--resume', help = "Checkpoint to continue from, up to --generations. Its simulation "
+                                           "parameters are used instead of the given ones.")
+
+    parser.add_argument('--replicas', type = int, default = 1,
+                        help = "Independent replicas to run in parallel. Their stats are aggregated, and the "
+                               "options of a single run (plots, checkpoints, events, tracking and metrics) can't be used.")
+    parser.add_argument('--workers', type = int, help = "Processes for the replicas. Uses every core by default.")
+    parser.add_argument('--community-step', type = int, default = 10,
+                        help = "Generations between community stats of the replicas. 0 disables them.")
+
+    return parser
+
+#-----------------------------------------------------------#
+
+def readOptions(rules, description, argv = None):
+    """
+    Returns the options given in argv, using the values of the
+    config file (if any) as defaults. Exits with an error if
+    replicas are asked for along with options of a single run.
+
+    @param rules: RuleSet object (see kernel.rules).
+    @param description: Description of the script.
+    @param argv: List of command line arguments. Uses sys.argv if None.
+    """
+    parser = makeParser(rules, description)
+    options, remaining = parser.parse_known_args(argv)
+
+    if options.config is not None:
+        with open(options.config, 'r') as config:
+            parser.set_defaults(**json.load(config))
+
+    options = parser.parse_args(argv)
+
+    if options.replicas > 1:
+        ignored = [option for option in single_run_options if getattr(options, option) not in (None, 'none', 0)]
+        if ignored:
+            parser.error("--replicas can't be used with " +
+                         ', '.join('--' + option.replace('_', '-') for option in ignored) + "!")
+
+    return options
+
+#-----------------------------------------------------------#
+
+def plot(network, title):
+    """
+    Plots a network, importing the drawing module of the package
+    of the running script only when it's needed.
+
+    @param network: Network object.
+    @param title: Title of the plot.
+    """
+    import draw.draw as draw
+    draw.plotNetwork(network, title)
+
+#-----------------------------------------------------------#
+
+def runReplicas(rules, options, params):
+    """
+    Runs the replicas asked for in options and prints (or writes)
+    the mean and standard deviation of their stats. Returns the
+    summaries of every replica.
+
+    @param rules: RuleSet object (see kernel.rules).
+    @param options: Options returned by readOptions.
+    @param params: Dictionary with the parameters of the default_params of rules.
+    """
+    summaries = ensemble.runEnsemble(rules, options.names, options.size, options.replicas,
+                                     options.generations, params, options.seed,
+                                     options.workers, options.community_step, options.source)
+    stats = ensemble.aggregateSummaries(summaries)
+
+    header = 'generation,' + ','.join(stat + '_' + name for stat in ('mean', 'std')
+                                      for name in ensemble.summaryNames(rules))
+    rows = [str(generation + 1) + ',' +
+            ','.join('%g' % value for value in np.concatenate((stats['mean'][generation],
+                                                               stats['std'][generation])))
+            for generation in range(options.generations)]
+
+    if options.counters is not None:
+        with open(options.counters, 'w') as counters:
+            counters.write(header + '\n' + ''.join(row + '\n' for row in rows))
+    if not options.quiet:
+        print(header)
+        for row in rows[options.step - 1::options.step]:
+            print(row)
+
+    return summaries
+
+#-----------------------------------------------------------#
+
+def main(rules, description, argv = None):
+    """
+    Runs a whole simulation with the given options. Returns the
+    final Network, or the summaries of every replica.
+
+    @param rules: RuleSet object (see kernel.rules).
+    @param description: Description of the script.
+    @param argv: List of command line arguments. Uses sys.argv if None.
+    """
+    options = readOptions(rules, description, argv)
+    params = {key:getattr(options, key) for key in rules.default_params}
+
+    if options.replicas > 1:
+        return runReplicas(rules, options, params)
+
+    if options.resume is not None:
+        network, start, saved_params = checkpoint.loadCheckpoint(options.resume)
+        if saved_params is not None:
+            params = saved_params
+        if options.events is not None:
+            network.events = events.EventLog(options.events, start)
+    else:
+        rng = seeding.makeGenerator(options.seed)
+        if options.seed is not None:
+            seeding.seedGraphs(options.seed)
+        network = nw.Network(rules, people.createPopulation(options.names, options.size, rng, options.source),
+                             rng, params['offsets'])
+        if options.events is not None:
+            network.events = events.EventLog(options.events)
+        sim.startSimulation(network, params)
+        start = 0
+
+        if options.events is not None and options.keyframe_step > 0:
+            replay.saveKeyframe(network, options.events, 0, params)
+
+    header = 'generation,' + ','.join(rules.counter_names)
+
+    # A resumed simulation keeps writing after the counters it already
+    # wrote up to its checkpoint.
+    counters = None
+    if options.counters is not None:
+        if options.resume is not None and os.path.exists(options.counters):
+            sim.truncateCounters(options.counters, start)
+            counters = open(options.counters, 'a')
+        else:
+            counters = open(options.counters, 'w')
+            counters.write(header + '\n')
+    if not options.quiet:
+        print(header)
+
+    # A resumed simulation keeps the communities and metrics it
+    # already saved up to its checkpoint.
+    tracker = None
+    if options.track is not None:
+        tracker = tracking.CommunityTracker(options.track_algorithm, options.track_step, seed = options.seed)
+        if options.resume is not None and os.path.exists(options.track):
+            tracker.load(options.track, start)
+
+    collector = None
+    if options.metrics is not None:
+        collector = metrics.MetricsCollector(network, options.metrics_step)
+        if options.resume is not None and os.path.exists(options.metrics):
+            collector.load(options.metrics, start)
+
+    for generation in range(start + 1, options.generations + 1):
+        sim.simulateGeneration(network, params)
+        row = str(generation) + ',' + ','.join(str(c) for c in sim.countNetwork(network))
+
+        if counters is not None:
+            counters.write(row + '\n')
+        if not options.quiet and generation % options.step == 0:
+            print(row)
+
+        if collector is not None:
+            collector.record(generation)
+
+        if tracker is not None and generation % tracker.step == 0:
+            tracker.update(network.graph, generation)
+
+        if options.plot == 'step' and generation % options.step == 0:
+            plot(network, "Network after " + str(generation) + " generations of relationships")
+
+        if options.events is not None and options.keyframe_step > 0 and generation % options.keyframe_step == 0:
+            replay.saveKeyframe(network, options.events, generation, params)
+
+        if options.checkpoint is not None and (generation % options.checkpoint_step == 0 or
+                                               generation == options.generations):
+            # The log and the counters must have every generation up to the checkpoint.
+            if network.events is not None:
+                network.events.flush()
+            if counters is not None:
+                counters.flush()
+            if tracker is not None:
+                tracker.save(options.track)
+            if collector is not None:
+                collector.save(options.metrics)
+            checkpoint.saveCheckpoint(network, options.checkpoint, generation, params)
+
+    if counters is not None:
+        counters.close()
+    if tracker is not None:
+        tracker.save(options.track)
+    if collector is not None:
+        collector.save(options.metrics)
+        collector.close()
+    if network.events is not None:
+        network.events.close()
+
+    if options.plot != 'none':
+        plot(network, "Final network after " + str(options.generations) + " generations of relationships")
+
+    return network
+
+#-----------------------------------------------------------#
+
+###### EOF: batch.py ########################################
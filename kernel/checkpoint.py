@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module saves the whole state of a simulation of a social
+network to a binary checkpoint, and loads it back so the
+simulation continues exactly as if it had never stopped.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+import os
+import json
+
+import numpy as np
+
+import kernel.people as people
+import kernel.network as nw
+import kernel.rules as rules
+
+#-----------------------------------------------------------#
+
+"""
+Names of the PairSet of a network with the same relation as each
+set of every Person (see kernel.pairsets).
+"""
+pair_sets = {'exes':'ex_pairs', 'friends':'friend_pairs'}
+
+#-----------------------------------------------------------#
+
+def setsToCSR(sets):
+    """
+    Returns the indptr and indices arrays of the compressed sparse
+    rows whose k-th row has the sorted values of sets[k].
+
+    @param sets: List of sets of integers.
+    """
+    lengths = np.fromiter((len(values) for values in sets), dtype = np.int64, count = len(sets))
+    indptr = np.concatenate(([0], np.cumsum(lengths)))
+    indices = np.fromiter((value for values in sets for value in sorted(values)),
+                          dtype = np.int64, count = indptr[-1])
+    return indptr, indices
+
+#-----------------------------------------------------------#
+
+def populationData(population):
+    """
+    Returns a list with the names of a population and a structured
+    array with their attributes (see people.attrib_dtype).
+
+    @param population: Population object or list of Person objects.
+    """
+    if type(population) is people.Population:
+        return population.names, population.data
+
+    data = np.empty(len(population), dtype = people.attrib_dtype)
+    for key in people.attrib_dtype.names:
+        data[key] = [person.attributes[key] for person in population]
+
+    return [person.name for person in population], data
+
+#-----------------------------------------------------------#
+
+def saveCheckpoint(network, file_path, generation = 0, params = None):
+    """
+    Saves the state of a network to an .npz file: its population,
+    couples, singles, exes, friends, edges, offsets and the state
+    of its random generator. The file is replaced at once, so an
+    interrupted save never breaks an older checkpoint.
+
+    @param network: Network object.
+    @param file_path: Path of the checkpoint. Should end with '.npz'.
+    @param generation: Number of generations already simulated.
+    @param params: Dictionary with the parameters of the simulation, if any.
+    """
+    names, data = populationData(network.people)
+    size = len(names)
+
+    # People never created by a Population have no exes nor friends.
+    exes = [set() for k in range(size)]
+    friends = [set() for k in range(size)]
+    persons = network.people.persons if type(network.people) is people.Population else network.people
+    for person in persons:
+        if person is not None:
+            exes[person.ident] = person.exes
+            friends[person.ident] = person.friends
+
+    exes_indptr, exes_indices = setsToCSR(exes)
+    friends_indptr, friends_indices = setsToCSR(friends)
+    edges, edge_values = network.edges.edgeList()
+
+    offsets = {key:np.asarray(value).tolist() for (key, value) in network.offsets.items()}
+    metadata = {'rules':network.rules.name, 'generation':generation, 'params':params, 'offsets':offsets,
+                'rng':network.rng.bit_generator.state}
+
+    temporary = file_path + '.tmp.npz'
+    np.savez(temporary,
+             names = np.array(names, dtype = str), attributes = data,
+             singles = np.array(network.singles, dtype = np.int64),
+             couples = network.in_relation,
+             exes_indptr = exes_indptr, exes_indices = exes_indices,
+             friends_indptr = friends_indptr, friends_indices = friends_indices,
+             edges = edges, edge_values = edge_values,
+             metadata = json.dumps(metadata))
+    os.replace(temporary, file_path)
+
+#-----------------------------------------------------------#
+
+def loadCheckpoint(file_path):
+    """
+    Returns a Network with the state saved in a checkpoint, the
+    number of generations it had simulated and the parameters
+    of its simulation (None if they weren't saved).
+
+    @param file_path: Path of a checkpoint made by saveCheckpoint.
+    """
+    with np.load(file_path) as checkpoint:
+        metadata = json.loads(str(checkpoint['metadata']))
+
+        society = people.Population(checkpoint['names'].tolist(), checkpoint['attributes'])
+
+        state = metadata['rng']
+        rng = np.random.Generator(getattr(np.random, state['bit_generator'])())
+        rng.bit_generator.state = state
+
+        # Checkpoints older than the rule sets only have friends in networks of friends.
+        name = metadata.get('rules', 'friend' if 'friends_indptr' in checkpoint.files else 'love')
+        network = nw.Network(rules.rule_sets[name], society, rng, metadata['offsets'])
+
+        # Only people with exes or friends need their Person object.
+        for attribute in ('exes', 'friends'):
+            if attribute + '_indptr' not in checkpoint.files:
+                continue
+            indptr, indices = checkpoint[attribute + '_indptr'], checkpoint[attribute + '_indices']
+            for ident in np.flatnonzero(np.diff(indptr)).tolist():
+                setattr(society[ident], attribute, set(indices[indptr[ident]:indptr[ident + 1]].tolist()))
+            getattr(network, pair_sets[attribute]).setRows(indptr, indices)
+
+        # The order of the singles and couples matters for the samples.
+        network.singles = checkpoint['singles'].tolist()
+        network.single_pos[:] = -1
+        network.single_pos[network.singles] = np.arange(len(network.singles))
+
+        couples = checkpoint['couples']
+        network.n_couples = len(couples)
+        network.couples[:len(couples)] = couples
+        network.couple_tiers[:len(couples)] = network.tiers.tiers(couples[:, 0], couples[:, 1])
+        network.partners[couples[:, 0]] = couples[:, 1]
+        network.partners[couples[:, 1]] = couples[:, 0]
+        network.couple_pos[couples.ravel()] = np.repeat(np.arange(len(couples)), 2)
+
+        for (p, q) in couples.tolist():
+            society[p].current_partner = q
+            society[q].current_partner = p
+
+        network.edges.setEdges(checkpoint['edges'], checkpoint['edge_values'])
+
+    return network, metadata['generation'], metadata['params']
+
+#-----------------------------------------------------------#
+
+###### EOF: checkpoint.py ###################################
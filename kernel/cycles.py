@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module counts the cycles of length 4 made by exes and
+current partners that a pair of people would complete by
+dating, looking only at the exes of the people involved.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+import numpy as np
+
+#-----------------------------------------------------------#
+
+def countCycles(network, a, b):
+    """
+    Returns the number of exes of a whose current partner is an
+    ex of b. That's how many cycles of length 4 a and b would
+    complete by dating each other.
+
+    @param network: Network object where a and b are.
+    @param a: Index of a Person object.
+    @param b: Index of a Person object.
+    """
+    partners = network.partners
+    exes_b = network.people[b].exes
+    return sum(1 for ex in network.people[a].exes if partners[ex] in exes_b)
+
+#-----------------------------------------------------------#
+
+def countCyclePairs(network, pairs):
+    """
+    Returns an array with the number of cycles every pair of
+    people in pairs would complete (see countCycles), looked up
+    in the sorted arrays of exes of network.
+
+    @param network: Network object where the people are.
+    @param pairs: Array of shape (k, 2) with indices of Person objects.
+    """
+    # Every ex of a, and the current partner of that ex.
+    owners, exes = network.ex_pairs.related(pairs[:, 0])
+    partners = network.partners[exes]
+    taken = partners >= 0
+    owners, partners = owners[taken], partners[taken]
+
+    # Exes are mutual, so the partner is an ex of b if b is one of theirs.
+    cycles = network.ex_pairs.contains(pairs[owners, 1], partners)
+    return np.bincount(owners[cycles], minlength = len(pairs))
+
+#-----------------------------------------------------------#
+
+###### EOF: cycles.py #######################################
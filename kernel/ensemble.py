@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module runs many independent replicas of the simulation
+of a social network in parallel, and aggregates what happened
+in each generation of every replica.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import kernel.people as people
+import kernel.network as nw
+import kernel.simulation as sim
+import kernel.seeding as seeding
+
+#-----------------------------------------------------------#
+
+# Names of the community stats at the end of the summaries made by runReplica.
+community_names = ('communities', 'modularity')
+
+#-----------------------------------------------------------#
+
+def summaryNames(rules):
+    """
+    Returns the names of the columns of the summaries made by
+    runReplica: the counters of a rule set and the community stats.
+
+    @param rules: RuleSet object (see kernel.rules).
+    """
+    return rules.counter_names + community_names
+
+#-----------------------------------------------------------#
+
+def summarizeCommunities(graph):
+    """
+    Returns the number of communities found in graph by the
+    multilevel algorithm and their modularity.
+
+    @param graph: igraph Graph object.
+    """
+    if graph.ecount() == 0:
+        return graph.vcount(), np.nan
+
+    clusters = graph.community_multilevel()
+    return len(clusters), clusters.modularity
+
+#-----------------------------------------------------------#
+
+def runReplica(rules, names, population_seed, seed, generations, params, community_step = 10):
+    """
+    Runs a whole simulation and returns a summary of every
+    generation as an array of shape (generations, len(summaryNames(rules))).
+    Community stats are only computed every community_step
+    generations, and are nan in the rest.
+
+    @param rules: RuleSet object (see kernel.rules).
+    @param names: List of tuples of names and sexes of the population.
+    @param population_seed: Seed of the attributes of the population, shared
+                            by every replica so they all simulate the same people.
+    @param seed: numpy.random.SeedSequence of the simulation of this replica,
+                 and of the community detection in its process.
+    @param generations: Number of generations to simulate.
+    @param params: Dictionary with the parameters of the default_params of rules.
+    @param community_step: Generations between community stats. 0 disables them.
+    """
+    # Spawning a child doesn't change the stream of the simulation.
+    seeding.seedGraphs(seed.spawn(1)[0])
+
+    society = people.makeAttributes(names, seeding.makeGenerator(population_seed))
+    network = nw.Network(rules, society, seeding.makeGenerator(seed), params['offsets'])
+    sim.startSimulation(network, params)
+
+    counters = len(rules.counter_names)
+    summary = np.full((generations, len(summaryNames(rules))), np.nan)
+
+    for generation in range(1, generations + 1):
+        sim.simulateGeneration(network, params)
+        summary[generation - 1, :counters] = sim.countNetwork(network)
+
+        if community_step > 0 and generation % community_step == 0:
+            summary[generation - 1, counters:] = summarizeCommunities(network.graph)
+
+    return summary
+
+#-----------------------------------------------------------#
+
+def runEnsemble(rules, file_path, size, replicas, generations, params, seed = None,
+                workers = None, community_step = 10, source = 'file'):
+    """
+    Runs independent replicas of a simulation over the same
+    population in a pool of processes. Returns an array of shape
+    (replicas, generations, len(summaryNames(rules))) with the
+    summary of every replica.
+
+    @param rules: RuleSet object (see kernel.rules).
+    @param file_path: Path of the file with rows of names and sexes.
+    @param size: Size of the population.
+    @param replicas: Number of replicas.
+    @param generations: Number of generations to simulate.
+    @param params: Dictionary with the parameters of the default_params of rules.
+    @param seed: Seed from which every other seed is spawned.
+    @param workers: Number of processes. Uses every core if None.
+    @param community_step: Generations between community stats. 0 disables them.
+    @param source: Where the names come from (see people.sampleNames).
+    """
+    population_seed, *replica_seeds = np.random.SeedSequence(seed).spawn(replicas + 1)
+    names_seed, attributes_seed = population_seed.spawn(2)
+    names = people.sampleNames(file_path, size, seeding.makeGenerator(names_seed), source)
+
+    with ProcessPoolExecutor(max_workers = workers) as pool:
+        runs = [pool.submit(runReplica, rules, names, attributes_seed, replica_seed,
+                            generations, params, community_step)
+                for replica_seed in replica_seeds]
+        summaries = [run.result() for run in runs]
+
+    return np.stack(summaries)
+
+#-----------------------------------------------------------#
+
+def aggregateSummaries(summaries):
+    """
+    Returns a dictionary with the mean, standard deviation, minimum
+    and maximum over the replicas of every column of the summaries
+    of each generation. Each value has shape (generations, columns of the summaries).
+
+    @param summaries: Array returned by runEnsemble.
+    """
+    # Generations without community stats are nan in every replica.
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+
+        return {'mean':np.nanmean(summaries, axis = 0),
+                'std':np.nanstd(summaries, axis = 0),
+                'min':np.nanmin(summaries, axis = 0),
+                'max':np.nanmax(summaries, axis = 0)}
+
+#-----------------------------------------------------------#
+
+###### EOF: ensemble.py #####################################
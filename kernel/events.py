@@ -0,0 +1,269 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module writes what happens to the relationships of a
+social network as a log of events, kept in a directory with a
+binary file for every column, so the history can be read back
+without simulating it again.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+import os
+import re
+
+import numpy as np
+
+#-----------------------------------------------------------#
+
+"""
+Global dictionaries with the code of every type of event and
+the type of every column of the log.
+"""
+event_types = {'create':0, # A couple is made.
+               'delete':1, # A couple breaks up.
+               'friend':2, # A friendship is made.
+               'unfriend':3} # Exes stop being friends.
+
+event_columns = {'generation':np.int32,
+                 'type':np.int8,
+                 'a':np.int32,
+                 'b':np.int32}
+
+#-----------------------------------------------------------#
+
+def columnPath(dir_path, column):
+    """
+    Returns the path of the file of a column of a log.
+
+    @param dir_path: Directory of the log.
+    @param column: Name of a column in event_columns.
+    """
+    return os.path.join(dir_path, column + '.bin')
+
+#-----------------------------------------------------------#
+
+def lastPath(dir_path):
+    """
+    Returns the path of the file with the last generation a log
+    has every event of.
+
+    @param dir_path: Directory of the log.
+    """
+    return os.path.join(dir_path, 'last_generation.txt')
+
+#-----------------------------------------------------------#
+
+def keyframePath(dir_path, generation):
+    """
+    Returns the path of the keyframe of a generation.
+
+    @param dir_path: Directory of the event log.
+    @param generation: Number of generations simulated at the keyframe.
+    """
+    return os.path.join(dir_path, 'keyframe_' + str(generation) + '.npz')
+
+#-----------------------------------------------------------#
+
+def listKeyframes(dir_path):
+    """
+    Returns a sorted list with the generations that have a keyframe.
+
+    @param dir_path: Directory of the event log.
+    """
+    found = (re.fullmatch(r'keyframe_(\d+)\.npz', name) for name in os.listdir(dir_path))
+    return sorted(int(match.group(1)) for match in found if match is not None)
+
+#-----------------------------------------------------------#
+
+def countEvents(dir_path):
+    """
+    Returns the number of events written in every column of a log.
+
+    @param dir_path: Directory of the log.
+    """
+    counts = [os.path.getsize(columnPath(dir_path, column)) // np.dtype(dtype).itemsize
+              if os.path.exists(columnPath(dir_path, column)) else 0
+              for (column, dtype) in event_columns.items()]
+
+    # An interrupted write may leave some columns longer than the rest.
+    return min(counts)
+
+def lastGeneration(dir_path):
+    """
+    Returns the last generation a log has every event of. Logs
+    written before it was kept reach their last event.
+
+    @param dir_path: Directory of the log.
+    """
+    if os.path.exists(lastPath(dir_path)):
+        with open(lastPath(dir_path), 'r') as last:
+            return int(last.read())
+
+    count = countEvents(dir_path)
+    if count == 0:
+        return 0
+
+    generations = np.memmap(columnPath(dir_path, 'generation'), mode = 'r',
+                            dtype = event_columns['generation'], shape = (count,))
+    return int(generations[-1])
+
+#-----------------------------------------------------------#
+
+class EventLog:
+    """
+    This class defines a log where events are appended. Events
+    are buffered in arrays and written in chunks at the end of
+    the files of their columns, which are never rewritten.
+    """
+
+    def __init__(self, dir_path, generation = None, chunk_size = 65536):
+        """
+        Opens a log, creating its directory if it doesn't exist.
+
+        @param dir_path: Directory of the log.
+        @param generation: Generation a resumed simulation continues from.
+                           Its later events are dropped, so they aren't
+                           logged twice. The log is emptied if None.
+        @param chunk_size: Number of events written at once.
+        """
+        self.dir_path = dir_path
+        self.chunk_size = chunk_size
+        self.generation = generation if generation is not None else 0
+
+        os.makedirs(dir_path, exist_ok = True)
+        self.truncate(generation if generation is not None else -1)
+
+        self.buffer = {column:np.zeros(chunk_size, dtype = dtype)
+                       for (column, dtype) in event_columns.items()}
+        self.buffered = 0
+
+    def __len__(self):
+        """
+        Returns the number of events in the log, buffered or not.
+        """
+        return countEvents(self.dir_path) + self.buffered
+
+    def truncate(self, generation):
+        """
+        Drops every written event after a generation, along with
+        the keyframes after it, which belong to another run.
+
+        @param generation: Last generation whose events are kept.
+        """
+        for keyframe in listKeyframes(self.dir_path):
+            if keyframe > generation:
+                os.remove(keyframePath(self.dir_path, keyframe))
+
+        keep = 0
+        count = countEvents(self.dir_path)
+        if count > 0:
+            generations = np.memmap(columnPath(self.dir_path, 'generation'), mode = 'r',
+                                    dtype = event_columns['generation'], shape = (count,))
+            keep = int(np.searchsorted(generations, generation, 'right'))
+            del generations
+
+        for (column, dtype) in event_columns.items():
+            with open(columnPath(self.dir_path, column), 'ab') as column_file:
+                column_file.truncate(keep * np.dtype(dtype).itemsize)
+
+        self.markGeneration(max(generation, 0))
+
+    def nextGeneration(self):
+        """
+        Marks the following events as part of the next generation.
+        """
+        self.generation += 1
+
+    def record(self, kind, a, b):
+        """
+        Appends an event to the log.
+
+        @param kind: Name of the type of the event (see event_types).
+        @param a: Index of a Person object.
+        @param b: Index of a Person object.
+        """
+        k = self.buffered
+        self.buffer['generation'][k] = self.generation
+        self.buffer['type'][k] = event_types[kind]
+        self.buffer['a'][k] = a
+        self.buffer['b'][k] = b
+
+        self.buffered += 1
+        if self.buffered == self.chunk_size:
+            self.write()
+
+    def write(self):
+        """
+        Writes the buffered events at the end of the files.
+        """
+        if self.buffered == 0:
+            return
+
+        for column in event_columns:
+            with open(columnPath(self.dir_path, column), 'ab') as column_file:
+                self.buffer[column][:self.buffered].tofile(column_file)
+
+        self.buffered = 0
+
+    def markGeneration(self, generation):
+        """
+        Writes the last generation the log has every event of.
+
+        @param generation: Number of the generation.
+        """
+        with open(lastPath(self.dir_path), 'w') as last:
+            last.write(str(generation))
+
+    def flush(self):
+        """
+        Writes the buffered events at the end of the files, once
+        every event of the current generation was recorded.
+        """
+        self.write()
+        self.markGeneration(self.generation)
+
+    def close(self):
+        """
+        Writes every event left in the buffer.
+        """
+        self.flush()
+
+#-----------------------------------------------------------#
+
+def readEvents(dir_path):
+    """
+    Returns a dictionary with a read-only memory map of every
+    column of a log, so it can be read without loading it.
+
+    @param dir_path: Directory of the log.
+    """
+    count = countEvents(dir_path)
+    if count == 0:
+        return {column:np.zeros(0, dtype = dtype) for (column, dtype) in event_columns.items()}
+
+    return {column:np.memmap(columnPath(dir_path, column), mode = 'r', dtype = dtype, shape = (count,))
+            for (column, dtype) in event_columns.items()}
+
+#-----------------------------------------------------------#
+
+def streamEvents(dir_path, chunk_size = 65536):
+    """
+    Yields dictionaries with the columns of consecutive chunks
+    of the events of a log.
+
+    @param dir_path: Directory of the log.
+    @param chunk_size: Number of events in each chunk.
+    """
+    columns = readEvents(dir_path)
+    count = len(columns['generation'])
+
+    for start in range(0, count, chunk_size):
+        yield {column:np.array(values[start:start + chunk_size]) for (column, values) in columns.items()}
+
+#-----------------------------------------------------------#
+
+###### EOF: events.py #######################################
@@ -0,0 +1,272 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module keeps the metrics of a social network up to date
+as its edges are added and deleted, so a table with the metrics
+of every generation doesn't need to scan the whole graph each
+generation.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+import os
+from collections import Counter
+
+import numpy as np
+
+#-----------------------------------------------------------#
+
+"""
+Columns of the table of metrics. Pairs are the pairs of people
+joined by any edge. The ratio is between the edges whose attribute
+is False and the ones whose attribute is True (friendly to romantic,
+or past to current). Components are -1 in the generations they
+weren't known.
+"""
+metrics_dtype = np.dtype([('generation', np.int32),
+                          ('singles_fraction', np.float32),
+                          ('pairs', np.int32),
+                          ('false_true_ratio', np.float32),
+                          ('mean_degree', np.float32),
+                          ('max_degree', np.int32),
+                          ('triangles', np.int64),
+                          ('transitivity', np.float32),
+                          ('components', np.int32)])
+
+#-----------------------------------------------------------#
+
+class MetricsCollector:
+    """
+    This class defines a watcher of the edges of a network (see
+    adjacency.SparseAdjacency) that keeps its metrics up to date.
+    Metrics are taken on the simple graph, where a pair of people
+    is joined if there is any edge between them: the degree of
+    everybody and its distribution, the triangles and connected
+    triples (whose ratio is the transitivity, or global clustering
+    coefficient), and the connected components, kept with a
+    union-find of the pairs. The union-find can't undo a pair, so
+    once a pair is gone for good the components are only known
+    again when they are recomputed, every recompute_step generations.
+    """
+
+    def __init__(self, network, recompute_step = 10, degree_bins = 32):
+        """
+        Creates a collector with the current edges of a network
+        and starts watching them.
+
+        @param network: Network object.
+        @param recompute_step: Generations between recomputed components,
+                               when pairs have been deleted.
+        @param degree_bins: Bins of the degree distribution. The last one
+                            has every degree from degree_bins - 1 on.
+        """
+        self.network = network
+        self.size = len(network.people)
+        self.recompute_step = recompute_step
+        self.degree_bins = degree_bins
+
+        self.rows = []
+        self.histograms = []
+
+        self.reset()
+        network.edges.watcher = self
+
+    def reset(self):
+        """
+        Computes every metric from the current edges of the network.
+        """
+        pairs, values = self.network.edges.edgeList()
+
+        self.multiplicity = Counter((pairs[:, 0] * self.size + pairs[:, 1]).tolist())
+        self.neighbors = [set() for ident in range(self.size)]
+        for key in self.multiplicity:
+            u, v = divmod(key, self.size)
+            self.neighbors[u].add(v)
+            self.neighbors[v].add(u)
+
+        self.degrees = np.array([len(near) for near in self.neighbors], dtype = np.int64)
+        self.histogram = np.bincount(np.minimum(self.degrees, self.degree_bins - 1),
+                                     minlength = self.degree_bins)
+
+        self.triples = int((self.degrees * (self.degrees - 1) // 2).sum())
+
+        # Every triangle is counted once by each of its pairs.
+        self.triangles = 0
+        for key in self.multiplicity:
+            u, v = divmod(key, self.size)
+            self.triangles += len(self.neighbors[u] & self.neighbors[v])
+        self.triangles //= 3
+
+        self.recomputeComponents()
+
+    def recomputeComponents(self):
+        """
+        Builds the union-find of the components from the current pairs.
+        """
+        self.parent = list(range(self.size))
+        self.components = self.size
+        self.removed = set() # Pairs in the union-find that are gone.
+        for key in self.multiplicity:
+            self.union(*divmod(key, self.size))
+
+    def find(self, u):
+        """
+        Returns the root of the component of u in the union-find.
+
+        @param u: Index of a person.
+        """
+        parent = self.parent
+        while parent[u] != u:
+            parent[u] = parent[parent[u]]
+            u = parent[u]
+        return u
+
+    def union(self, u, v):
+        """
+        Joins the components of u and v in the union-find.
+
+        @param u: Index of a person.
+        @param v: Index of a person.
+        """
+        root_u, root_v = self.find(u), self.find(v)
+        if root_u != root_v:
+            self.parent[root_u] = root_v
+            self.components -= 1
+
+    def changeDegree(self, u, change):
+        """
+        Changes the degree of u by one, along with its distribution
+        and the connected triples.
+
+        @param u: Index of a person.
+        @param change: 1 or -1.
+        """
+        degree = self.degrees[u]
+        self.histogram[min(degree, self.degree_bins - 1)] -= 1
+        self.histogram[min(degree + change, self.degree_bins - 1)] += 1
+        self.degrees[u] = degree + change
+
+        # A person of degree d is the middle of d choose 2 triples.
+        self.triples += degree if change > 0 else -(degree - 1)
+
+    def addEdge(self, u, v, value):
+        """
+        Updates the metrics after an edge is added between u and v.
+
+        @param u: Index of a person.
+        @param v: Index of a person.
+        @param value: Value of the attribute of the edge.
+        """
+        key = min(u, v) * self.size + max(u, v)
+        self.multiplicity[key] += 1
+        if self.multiplicity[key] > 1:
+            return
+
+        self.triangles += len(self.neighbors[u] & self.neighbors[v])
+        self.neighbors[u].add(v)
+        self.neighbors[v].add(u)
+        self.changeDegree(u, 1)
+        self.changeDegree(v, 1)
+        self.union(u, v)
+        self.removed.discard(key)
+
+    def deleteEdge(self, u, v, value):
+        """
+        Updates the metrics after an edge is deleted between u and v.
+
+        @param u: Index of a person.
+        @param v: Index of a person.
+        @param value: Value of the attribute of the edge.
+        """
+        key = min(u, v) * self.size + max(u, v)
+        self.multiplicity[key] -= 1
+        if self.multiplicity[key] > 0:
+            return
+
+        del self.multiplicity[key]
+        self.neighbors[u].discard(v)
+        self.neighbors[v].discard(u)
+        self.triangles -= len(self.neighbors[u] & self.neighbors[v])
+        self.changeDegree(u, -1)
+        self.changeDegree(v, -1)
+
+        # The pair comes back at once if the attribute of its edge
+        # is just changing.
+        self.removed.add(key)
+
+    def record(self, generation):
+        """
+        Adds a row to the table with the current metrics.
+
+        @param generation: Number of the generation.
+        """
+        if self.removed and generation % self.recompute_step == 0:
+            self.recomputeComponents()
+
+        counts = self.network.edges.counts
+        pairs = len(self.multiplicity)
+
+        self.rows.append((generation,
+                          len(self.network.singles) / self.size,
+                          pairs,
+                          counts[False] / counts[True] if counts[True] > 0 else np.nan,
+                          2 * pairs / self.size,
+                          self.degrees.max() if self.size > 0 else 0,
+                          self.triangles,
+                          3 * self.triangles / self.triples if self.triples > 0 else np.nan,
+                          -1 if self.removed else self.components))
+        self.histograms.append(self.histogram.copy())
+
+    def table(self):
+        """
+        Returns a structured array with a row for every recorded
+        generation (see metrics_dtype), and an array of shape
+        (generations, degree_bins) with the degree distribution
+        of each one.
+        """
+        return (np.array(self.rows, dtype = metrics_dtype),
+                np.array(self.histograms, dtype = np.int64).reshape(len(self.histograms), self.degree_bins))
+
+    def save(self, file_path):
+        """
+        Saves the table of metrics to an .npz file. The file is
+        replaced at once, so an interrupted save keeps the last one.
+
+        @param file_path: Path of the file. Should end with '.npz'.
+        """
+        table, degrees = self.table()
+        temporary = file_path + '.tmp.npz'
+        np.savez(temporary, table = table, degrees = degrees)
+        os.replace(temporary, file_path)
+
+    def load(self, file_path, generation):
+        """
+        Takes the rows of a table saved before up to a generation, so
+        a resumed simulation keeps adding rows after its checkpoint.
+
+        @param file_path: Path of an .npz file written by save.
+        @param generation: Last generation whose row is kept.
+        """
+        with np.load(file_path) as saved:
+            table, degrees = saved['table'], saved['degrees']
+
+        if degrees.shape[1] != self.degree_bins:
+            raise ValueError("The saved degree distribution has other bins!")
+
+        kept = table['generation'] <= generation
+        self.rows = table[kept].tolist()
+        self.histograms = list(degrees[kept])
+
+    def close(self):
+        """
+        Stops watching the edges of the network.
+        """
+        if self.network.edges.watcher is self:
+            self.network.edges.watcher = None
+
+#-----------------------------------------------------------#
+
+###### EOF: metrics.py ######################################
@@ -0,0 +1,735 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module simulates an affection social network. What kind
+of network it is (of lovers, or of lovers and friends) is told
+by its rule set (see kernel.rules).
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+import numpy as np
+
+import kernel.people as people
+from kernel.tiers import TierCache
+from kernel.adjacency import SparseAdjacency
+from kernel.cycles import countCycles, countCyclePairs
+from kernel.pairsets import PairSet
+
+#-----------------------------------------------------------#
+
+class Network:
+    """
+    This class defines a container for all the data needed in
+    order to simulate a social network following a rule set.
+    """
+
+    def __init__(self, rules, society, rng = None, offsets = None):
+        """
+        Creates all the data needed to compute the simulation.
+
+        @param rules: RuleSet object (see kernel.rules).
+        @param society: Population object or list of People.
+        @param rng: numpy.random.Generator used for every random choice of
+                    the simulation. A new one seeded by the OS is used if None.
+        @param offsets: Dictionary with the offsets to change from the
+                        default_offsets of rules.
+        """
+        self.rules = rules
+        self.people = society
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+        default_offsets = rules.default_offsets
+        if offsets is not None and not set(offsets) <= set(default_offsets):
+            raise ValueError("Unknown offsets: " + ', '.join(set(offsets) - set(default_offsets)))
+        self.offsets = {key:np.array(value, dtype = float) if key.endswith('_tiers') else float(value)
+                        for (key, value) in dict(default_offsets, **(offsets or {})).items()}
+
+        # In the beggining, everybody is single.
+        self.singles = [ident for ident in range(len(society))]
+
+        # Couples are the first n_couples rows of a matrix big enough
+        # for everybody to be in a relationship.
+        self.couples = np.zeros((len(society) // 2, 2), dtype = int)
+        self.n_couples = 0
+
+        # Angle tier of every couple, next to its row of couples, so
+        # breakups don't have to compute them every generation.
+        self.couple_tiers = np.zeros(len(society) // 2, dtype = np.int8)
+
+        # Position of everybody in the singles list (-1 if they're not in it),
+        # index of their partner (-1 if they have none) and position of their
+        # couple in in_relation, so none of them has to be searched for.
+        self.single_pos = np.arange(len(society))
+        self.partners = np.full(len(society), -1)
+        self.couple_pos = np.full(len(society), -1)
+
+        # The index of every person in the graph is its id.
+        if type(society) is not people.Population:
+            for (person, i) in zip(self.people, range(len(self.people))):
+                if person.ident != i:
+                    raise ValueError("society is not sorted by the ids of its people!")
+
+        # The edges are kept in sparse arrays, and the igraph Graph is
+        # only built from them when it's asked for (see graph).
+        self.edges = SparseAdjacency(len(self.people), rules.attribute)
+        self.graph_cache = None
+        self.graph_version = None
+
+        # Attributes never change after the population is made, so we keep
+        # them as the rows of a matrix along with their magnitudes.
+        self.attributes = people.attribMatrix(self.people)
+        self.norms = np.sqrt(np.sum(self.attributes ** 2, axis = 1))
+        self.tiers = TierCache(self.attributes, self.norms)
+
+        # Exes and friends of everybody in sorted arrays, to look up
+        # many pairs at once.
+        self.ex_pairs = PairSet(len(society))
+        self.friend_pairs = PairSet(len(society))
+
+        # EventLog (see kernel.events) where every change to the
+        # relationships is recorded, if any.
+        self.events = None
+
+    @property
+    def in_relation(self):
+        """
+        Returns a (n_couples, 2) array with the indices of the
+        people in each current relationship.
+        """
+        return self.couples[:self.n_couples]
+
+    @property
+    def graph(self):
+        """
+        Returns an igraph Graph with the people and edges of this
+        network. Every vertex has the id of its person as 'ident'
+        attribute. The graph is kept until the edges change.
+        """
+        if self.graph_version != self.edges.version:
+            self.graph_cache = self.edges.toGraph()
+            self.graph_version = self.edges.version
+
+        return self.graph_cache
+
+    def __str__(self):
+        """
+        Returns a string representation of the data contained
+        in this Network.
+        """
+        return ''.join('Network with ' + str(len(self.people)) + ' people.\n'
+                      + str(len(self.singles)) + ' are single.\n'
+                      + str(2*len(self.in_relation)) + ' are in relationships.\n'
+                      + str(len(self.edges)) + ' edges.\n')
+
+#-----------------------------------------------------------#
+
+def drawSample(rng, population, size):
+    """
+    Returns a list with a random sample (without replacement)
+    of a given size from population.
+
+    @param rng: numpy.random.Generator.
+    @param population: Sequence to take the sample from.
+    @param size: Size of the sample.
+    """
+    return [population[k] for k in rng.choice(len(population), size, replace = False).tolist()]
+
+#-----------------------------------------------------------#
+
+def computeAngleBtwnPeople(network, a, b):
+    """
+    Returns the angle between two people's attributes vector.
+
+    @param network: Network object where a and b are.
+    @param a: Index of a Person object.
+    @param b: Index of a Person object.
+    """
+    cosine = (np.dot(network.attributes[a], network.attributes[b]) /
+              (network.norms[a] * network.norms[b]))
+
+    # Rounding can push the cosine of identical vectors past 1.
+    return np.arccos(np.clip(cosine, -1, 1))
+
+#-----------------------------------------------------------#
+
+def alreadyInRelation(network, pos_partner):
+    """
+    Returns wheter or not the possible partner is already in
+    a relationship.
+
+    @param network: Network object where the possible partner is.
+    @param pos_partner: Index of a possible partner.
+    """
+    return network.partners[pos_partner] != -1
+
+#-----------------------------------------------------------#
+
+def addSingle(network, ident):
+    """
+    Puts a person at the end of the singles list of network.
+
+    @param network: Network object.
+    @param ident: Index of a Person object.
+    """
+    network.single_pos[ident] = len(network.singles)
+    network.singles.append(ident)
+
+#-----------------------------------------------------------#
+
+def removeSingle(network, ident):
+    """
+    Takes a person out of the singles list of network by moving
+    the last single into their position.
+
+    @param network: Network object.
+    @param ident: Index of a Person object in the singles list.
+    """
+    position = network.single_pos[ident]
+    last = network.singles.pop()
+
+    if last != ident:
+        network.singles[position] = last
+        network.single_pos[last] = position
+    network.single_pos[ident] = -1
+
+#-----------------------------------------------------------#
+
+def areIncompatible(p, q):
+    """
+    Returns whether or not p and q have incompatible sexual
+    orientations.
+
+    @param p: Person object.
+    @param q: Person object.
+    """
+    # If they have incompatible orientations.
+    if p.attributes['orientation'] + q.attributes['orientation'] == 0:
+        return True
+    
+    # If we have a heterosexual men or a woman with another
+    # person of the same sex, and viceversa.
+    if p.attributes['orientation'] == -1:
+        if p.attributes['sex'] == q.attributes['sex']:
+            return True
+    elif p.attributes['orientation'] == 1:
+        if p.attributes['sex'] != q.attributes['sex']:
+            return True
+            
+    if q.attributes['orientation'] == -1:
+        if p.attributes['sex'] == q.attributes['sex']:
+            return True
+    elif q.attributes['orientation'] == 1:
+        if p.attributes['sex'] != q.attributes['sex']:
+            return True
+
+    return False
+
+#-----------------------------------------------------------#
+
+def createRelationship(network, p, q):
+    """
+    Adds a new relationship between p and q of a social network.
+
+    @param network: Network object where p and q must be part of.
+    @param p: Person object.
+    @param q: Person object.
+    """
+    p_position = p.ident
+    q_position = q.ident
+
+    network.couple_pos[[p_position, q_position]] = network.n_couples
+    network.couples[network.n_couples] = (p_position, q_position)
+    network.couple_tiers[network.n_couples] = network.tiers.tier(p_position, q_position)
+    network.n_couples += 1
+    network.partners[p_position] = q_position
+    network.partners[q_position] = p_position
+    p.current_partner = q.ident
+    q.current_partner = p.ident
+
+    if network.events is not None:
+        network.events.record('create', p.ident, q.ident)
+
+    # We add an edge that's marked as a current relationship.
+    network.edges.addEdge(p_position, q_position, True)
+
+#-----------------------------------------------------------#
+
+def reduceSinglesPool(network):
+    """
+    Deletes the indices of everybody in a relationship from
+    the singles list of network.
+
+    @param network: Network object whose singles list will be reduced.
+    """
+    in_relation = network.in_relation.ravel()
+    for person in in_relation[network.single_pos[in_relation] != -1]:
+        removeSingle(network, person)
+
+#-----------------------------------------------------------#
+
+def computeRomanticRelationships(network, sample_pool = 20, pos_pool = 10, batched = False):
+    """
+    Computes what relationships are made from the pool of
+    single people of the network.
+
+    @param network: Network where the relationships will be computed.
+    @param sample_pool: Size of the sample from the singles pool.
+    @param pos_pool: Size of the sample of 'dates' a person will have.
+    @param batched: Whether to evaluate all the dates at once with
+                    computeRomanticBatch.
+    """
+    if batched:
+        computeRomanticBatch(network, sample_pool, pos_pool)
+        return
+
+    # To avoid making too many couples we just take a random sample from
+    # the pool of single people.
+    # We reduce the pool sizes in case they're too big.
+    if len(network.singles) < sample_pool:
+        sample_pool = len(network.singles)
+    if len(network.singles) < pos_pool:
+        pos_pool = len(network.singles)
+
+    for person in drawSample(network.rng, network.singles, sample_pool):
+        # First, we skip this person if its already in a relationship.
+        if alreadyInRelation(network, person): continue
+
+        p = network.people[person]
+        
+        # Now, we suppose that a single will know only a tiny part of the community.
+        for pos_partner in drawSample(network.rng, network.singles, pos_pool):
+            # We skip if it's the same person.
+            if person == pos_partner: continue
+            
+            # We skip this person if its already in a relationship.
+            if alreadyInRelation(network, pos_partner): continue
+
+            q = network.people[pos_partner]
+
+            # We check if they can even date.
+            if areIncompatible(p, q): continue
+
+            prob = 1 # At the start, it's a given that they'll date.
+
+            # We adjust the probability if they're friends, exes, or if they
+            # complete a cycle of length 4.
+            if network.rules.friendships and pos_partner in p.friends:
+                prob -= network.offsets['friend']
+            if pos_partner in p.exes:
+                prob -= network.offsets['ex']
+            prob -= network.offsets['cycle'] * countCycles(network, person, pos_partner)
+
+            prob -= network.offsets['romance_tiers'][network.tiers.tier(person, pos_partner)]
+
+            if network.rng.random() <= prob:
+                createRelationship(network, p, q)
+                break
+
+    # Before returning, we update the singles' list and the graph.
+    reduceSinglesPool(network)
+    network.edges.flush()
+
+#-----------------------------------------------------------#
+
+def areIncompatibleBatch(network, a, b):
+    """
+    Returns a boolean array telling whether or not each pair
+    (a[k], b[k]) has incompatible sexual orientations. Follows
+    the same rules as areIncompatible.
+
+    @param network: Network object where the people are.
+    @param a: Array of indices of Person objects.
+    @param b: Array of indices of Person objects, same shape as a.
+    """
+    sex = network.attributes[:, people.attrib_columns['sex']]
+    orientation = network.attributes[:, people.attrib_columns['orientation']]
+
+    same_sex = sex[a] == sex[b]
+    o_a, o_b = orientation[a], orientation[b]
+
+    return ((o_a + o_b == 0) |
+            ((o_a == -1) & same_sex) | ((o_a == 1) & ~same_sex) |
+            ((o_b == -1) & same_sex) | ((o_b == 1) & ~same_sex))
+
+#-----------------------------------------------------------#
+
+def computeDatingProbs(network, pairs):
+    """
+    Returns the probability of every pair of people in pairs
+    starting a relationship, as computed by computeRomanticRelationships.
+
+    @param network: Network object where the people are.
+    @param pairs: Array of shape (k, 2) with indices of compatible singles.
+    """
+    prob = np.ones(len(pairs)) # At the start, it's a given that they'll date.
+
+    # We adjust the probability if they're friends, exes, or if they
+    # complete a cycle of length 4.
+    if network.rules.friendships:
+        prob -= network.offsets['friend'] * network.friend_pairs.contains(pairs[:, 0], pairs[:, 1])
+    prob -= network.offsets['ex'] * network.ex_pairs.contains(pairs[:, 0], pairs[:, 1])
+
+    prob -= network.offsets['cycle'] * countCyclePairs(network, pairs)
+
+    prob -= network.offsets['romance_tiers'][network.tiers.tiers(pairs[:, 0], pairs[:, 1])]
+
+    return prob
+
+#-----------------------------------------------------------#
+
+def computeRomanticBatch(network, sample_pool = 20, pos_pool = 10):
+    """
+    Computes what relationships are made from the pool of single
+    people of the network, drawing every date of the sample at once.
+    Dates are evaluated in the same order as in computeRomanticRelationships
+    so that nobody ends up with two partners.
+
+    @param network: Network where the relationships will be computed.
+    @param sample_pool: Size of the sample from the singles pool.
+    @param pos_pool: Size of the sample of 'dates' a person will have.
+    """
+    singles = np.array(network.singles, dtype = int)
+    if len(singles) < 2:
+        return
+
+    sample_pool = min(sample_pool, len(singles))
+    pos_pool = min(pos_pool, len(singles))
+
+    # Everybody in the sample gets pos_pool dates. Dates are drawn with
+    # replacement, so we drop the repeated ones from each row.
+    persons = singles[network.rng.choice(len(singles), sample_pool, replace = False)]
+    dates = singles[network.rng.integers(0, len(singles), (sample_pool, pos_pool))]
+
+    order = np.argsort(dates, axis = 1, kind = 'stable')
+    sorted_dates = np.take_along_axis(dates, order, axis = 1)
+    repeated = np.zeros(dates.shape, dtype = bool)
+    np.put_along_axis(repeated, order[:, 1:], sorted_dates[:, 1:] == sorted_dates[:, :-1], axis = 1)
+
+    suitors = np.repeat(persons[:, None], pos_pool, axis = 1)
+    valid = ~repeated & (suitors != dates)
+    valid[valid] = ~areIncompatibleBatch(network, suitors[valid], dates[valid])
+
+    prob = np.zeros(dates.shape)
+    prob[valid] = computeDatingProbs(network, np.column_stack((suitors[valid], dates[valid])))
+    accepted = valid & (network.rng.random(dates.shape) <= prob)
+
+    # Now we make the couples, skipping anybody who got a partner before.
+    for row in np.flatnonzero(accepted.any(axis = 1)):
+        person = persons[row]
+        if alreadyInRelation(network, person): continue
+
+        for pos_partner in dates[row, accepted[row]]:
+            if alreadyInRelation(network, pos_partner): continue
+
+            createRelationship(network, network.people[person], network.people[pos_partner])
+            break
+
+    reduceSinglesPool(network)
+    network.edges.flush()
+
+#-----------------------------------------------------------#
+
+def separateCouple(network, p, q):
+    """
+    Changes current_partner and exes of p and q, returns them to
+    the pool of singles and updates their edge.
+
+    @param network: Network object where p and q must be.
+    @param p: Person object.
+    @param q: Person object.
+    """
+    network.partners[[p.ident, q.ident]] = -1
+    network.couple_pos[[p.ident, q.ident]] = -1
+
+    if network.events is not None:
+        network.events.record('delete', p.ident, q.ident)
+
+    p.current_partner = None
+    q.current_partner = None
+    
+    # We return the couple to the pool on singles.
+    addSingle(network, p.ident)
+    addSingle(network, q.ident)
+
+    p.exes.add(q.ident)
+    q.exes.add(p.ident)
+    network.ex_pairs.add(p.ident, q.ident)
+
+    # We either mark the couple's edge as a past relationship, or delete
+    # it. Friends may have a friendly edge too, so we make sure we only
+    # delete the romantic one.
+    if network.rules.keep_past:
+        network.edges.changeEdge(p.ident, q.ident, True, False)
+    else:
+        network.edges.deleteEdge(p.ident, q.ident, True)
+
+#-----------------------------------------------------------#
+
+def deleteRelationship(network, couple):
+    """
+    Deletes a relationship from the couples of network and
+    separates its couple.
+
+    @param network: Network object where p and q must be.
+    @param couple: Tuple of indices of Person objects.
+    """
+    # The couple may be a row of in_relation, which is about to change.
+    p, q = network.people[couple[0]], network.people[couple[1]]
+
+    # We move the last couple into the position of this one.
+    position = network.couple_pos[p.ident]
+    network.n_couples -= 1
+    if position != network.n_couples:
+        last = network.couples[network.n_couples]
+        network.couples[position] = last
+        network.couple_tiers[position] = network.couple_tiers[network.n_couples]
+        network.couple_pos[last] = position
+
+    separateCouple(network, p, q)
+
+#-----------------------------------------------------------#
+
+def deleteRelationships(network, broken):
+    """
+    Deletes many relationships from the couples of network at
+    once and separates their couples. Returns the array of
+    deleted couples.
+
+    @param network: Network object.
+    @param broken: Boolean array telling which rows of in_relation to delete.
+    """
+    deleted = network.in_relation[broken]
+    kept = network.in_relation[~broken]
+    kept_tiers = network.couple_tiers[:network.n_couples][~broken]
+
+    network.n_couples = len(kept)
+    network.couples[:len(kept)] = kept
+    network.couple_tiers[:len(kept)] = kept_tiers
+    network.couple_pos[kept.ravel()] = np.repeat(np.arange(len(kept)), 2)
+
+    for (p, q) in deleted.tolist():
+        separateCouple(network, network.people[p], network.people[q])
+
+    return deleted
+
+#-----------------------------------------------------------#
+
+def computeBreakups(network):
+    """
+    Computes the relationships that get broken up.
+
+    @network: Network where the people are.
+    """
+    couples = network.in_relation
+
+    tiers = network.couple_tiers[:network.n_couples]
+    break_prob = network.offsets['breakup'] - network.offsets['breakup_tiers'][tiers]
+    broken = network.rng.random(len(couples)) <= break_prob
+
+    deleted = deleteRelationships(network, broken)
+
+    if network.rules.friendships:
+        loseFriends(network, deleted)
+
+    network.edges.flush()
+
+#-----------------------------------------------------------#
+
+def loseFriends(network, exes):
+    """
+    Computes which pairs of exes that were friends stop being friends.
+
+    @param network: Network where the people are.
+    @param exes: Array of shape (k, 2) with indices of couples that broke up.
+    """
+    # Most exes stop being friends.
+    broken_friends = np.fromiter((q in network.people[p].friends for (p, q) in exes.tolist()),
+                                 dtype = bool, count = len(exes))
+    lost = network.rng.random(np.count_nonzero(broken_friends)) <= network.offsets['friend_loss']
+
+    for (p, q) in exes[broken_friends][lost].tolist():
+        network.people[p].friends.remove(q)
+        network.people[q].friends.remove(p)
+        network.friend_pairs.remove(p, q)
+        network.edges.deleteEdge(p, q, False)
+
+        if network.events is not None:
+            network.events.record('unfriend', p, q)
+
+#----------------------------------------------------------------------------------#
+## FRIENDSHIP FUNCTIONS
+## Only used by rule sets with friendships.
+#----------------------------------------------------------------------------------#
+
+def makeFriendship(network, p, q):
+    """
+    Creates an edge between p and q, and puts each other in
+    their friends set.
+
+    @param network: Network object.
+    @param p: Person object.
+    @param q: Person object.
+    """
+    p.friends.add(q.ident)
+    q.friends.add(p.ident)
+    network.friend_pairs.add(p.ident, q.ident)
+    
+    p_position = p.ident
+    q_position = q.ident
+    
+    # We add an edge that's marked as a friendly relationship.
+    network.edges.addEdge(p_position, q_position, False)
+
+    if network.events is not None:
+        network.events.record('friend', p_position, q_position)
+
+#-----------------------------------------------------------#
+
+def joinGroup(network, p, q, friend_limit = 6):
+    """
+    Makes p a friend of q and of every friend of q they aren't
+    friends with yet, in the order of their ids, as long as neither
+    of them has reached friend_limit. Returns the number of
+    friendships made.
+
+    @param network: Network object.
+    @param p: Person object joining the group.
+    @param q: Person object whose friends are the group.
+    @param friend_limit: Limits of friends a person can have.
+    """
+    # The friends sets are the adjacency sets of the friendly edges,
+    # so the missing edges are the members p isn't a friend of.
+    group = [q.ident] + sorted(q.friends)
+    new_friends = []
+
+    for ident in group:
+        if len(p.friends) >= friend_limit: break
+
+        friend = network.people[ident]
+        if ident == p.ident or ident in p.friends: continue
+        if len(friend.friends) >= friend_limit: continue
+
+        p.friends.add(ident)
+        friend.friends.add(p.ident)
+        network.friend_pairs.add(p.ident, ident)
+        new_friends.append(ident)
+
+    # We add an edge that's marked as a friendly relationship for each one.
+    for ident in new_friends:
+        network.edges.addEdge(p.ident, ident, False)
+
+        if network.events is not None:
+            network.events.record('friend', p.ident, ident)
+
+    return len(new_friends)
+
+#-----------------------------------------------------------#
+
+def computePairsFriend(network, sample_size, pos_size):
+    """
+    Computes pairs of friends that'll be the foundation
+    for the rest of the friendships in the network.
+
+    @param network: Network object.
+    @param sample_size: Size of the sample of outgoing people.
+    @param pos_size: Size of possible friends for a friend.
+    """
+    if len(network.people) < sample_size:
+        sample_size = len(network.people)
+    if len(network.people) < pos_size:
+        pos_size = len(network.people)
+
+    for i in drawSample(network.rng, range(len(network.people)), sample_size):
+        person = network.people[i]
+        if person.friends: continue
+
+        for j in drawSample(network.rng, range(len(network.people)), pos_size):
+            pos_friend = network.people[j]
+            if pos_friend.friends: continue
+
+            if person == pos_friend: continue
+            if i in pos_friend.friends: break
+            if person.current_partner == j: continue
+            
+            prob = 1 # At the start, it's a given that they'll be friends.
+
+            # We adjust the probability if they're friends, exes, or if they
+            # complete a cycle of length 4.
+            if j in person.exes:
+                prob -= network.offsets['friendship_ex']
+
+            prob -= network.offsets['friendship_tiers'][network.tiers.tier(i, j)]
+
+            if network.rng.random() <= prob:
+                makeFriendship(network, person, pos_friend)
+                break
+
+    network.edges.flush()
+
+#-----------------------------------------------------------#
+
+def computeFriendGroups(network, sample_size, pos_size, friend_limit = 6):
+    """
+    Computes whether or not a person from a sample of a network
+    joins a friendgroup. Returns the number of friendships made.
+
+    @param network: Network object.
+    @param sample_size: Size of the sample of outgoing people.
+    @param pos_size: Size of possible friends for a friend.
+    @param friend_limit: Limits of friends a person can have.
+    """
+    if len(network.people) < sample_size:
+        sample_size = len(network.people)
+
+    made = 0
+    for i in drawSample(network.rng, range(len(network.people)), sample_size):
+        person = network.people[i]
+        if len(person.friends) >= friend_limit: continue
+        
+        for j in drawSample(network.rng, range(len(network.people)), pos_size):
+            pos_friend = network.people[j]
+            if len(pos_friend.friends) >= friend_limit: continue
+        
+            if person == pos_friend: continue
+            if i in pos_friend.friends: break
+            if person.current_partner == j: continue
+            
+            prob = 1 # At the start, it's a given that they'll be friends.
+
+            # We adjust the probability if they're friends, exes, or if they
+            # complete a cycle of length 4.
+            if j in person.exes:
+                prob -= network.offsets['friendship_ex']
+
+            prob -= network.offsets['friendship_tiers'][network.tiers.tier(i, j)]
+
+            if network.rng.random() <= prob:
+                # Now, person joins the friendgroup of their new friend.
+                made += joinGroup(network, person, pos_friend, friend_limit)
+                break
+
+    network.edges.flush()
+    return made
+
+#-----------------------------------------------------------#
+
+def computeFriendships(network, sample_size = 70, pos_size = 8, friend_limit = 6):
+    """
+    Decides what friendships get made and adds the respective edges
+    to the network.
+
+    @param network: Network object.
+    @param sample_size: Number of people that'll get selected to make friends.
+    @param pos_size: Number of possible friends for a person.
+    @param friend_limit: Limits of friends a person can have.
+    """
+    computePairsFriend(network, sample_size, pos_size)
+    computeFriendGroups(network, sample_size, pos_size, friend_limit)
+
+#-----------------------------------------------------------#
+
+###### EOF: network.py ######################################
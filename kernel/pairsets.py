@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module keeps symmetric relations between people, such as
+being exes or friends, in sorted arrays, so they can be looked
+up for many pairs of people at once.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+import numpy as np
+
+#-----------------------------------------------------------#
+
+def expandRows(keys, rows, size):
+    """
+    Returns, for every key of a sorted array whose row is in rows,
+    the position of its row in rows and the key itself. A key k
+    belongs to row k // size.
+
+    @param keys: Sorted array of keys.
+    @param rows: Array of rows.
+    @param size: Number of columns of every row.
+    """
+    starts = np.searchsorted(keys, rows * size)
+    lengths = np.searchsorted(keys, (rows + 1) * size) - starts
+
+    owners = np.repeat(np.arange(len(rows)), lengths)
+    positions = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    return owners, keys[np.repeat(starts, lengths) + positions]
+
+#-----------------------------------------------------------#
+
+class PairSet:
+    """
+    This class defines a symmetric relation between the people of
+    a population, stored as a sorted array with the key u*size + v
+    of every related (u, v) in both directions, plus a buffer of the
+    changes made since the array was last built. The buffer is merged
+    into the array once it has more than a fraction of its keys, or
+    before the array is searched.
+    """
+
+    def __init__(self, size, compact_ratio = 0.25):
+        """
+        Creates an empty relation.
+
+        @param size: Number of people.
+        @param compact_ratio: Fraction of the keys the buffer may have
+                              before it's merged into the array.
+        """
+        self.size = size
+        self.compact_ratio = compact_ratio
+
+        self.keys = np.zeros(0, dtype = np.int64)
+        self.added = set()
+        self.deleted = set()
+
+    def __len__(self):
+        """
+        Returns the number of related pairs.
+        """
+        return (len(self.keys) + len(self.added) - len(self.deleted)) // 2
+
+    def add(self, u, v):
+        """
+        Relates u and v, if they weren't already.
+
+        @param u: Index of a person.
+        @param v: Index of a person.
+        """
+        u, v = int(u), int(v)
+        for key in (u * self.size + v, v * self.size + u):
+            if key in self.deleted:
+                self.deleted.discard(key)
+            elif not self.inKeys(key):
+                self.added.add(key)
+
+        self.flush()
+
+    def remove(self, u, v):
+        """
+        Stops relating u and v, if they were.
+
+        @param u: Index of a person.
+        @param v: Index of a person.
+        """
+        u, v = int(u), int(v)
+        for key in (u * self.size + v, v * self.size + u):
+            if key in self.added:
+                self.added.discard(key)
+            elif self.inKeys(key):
+                self.deleted.add(key)
+
+        self.flush()
+
+    def inKeys(self, key):
+        """
+        Returns whether or not key is in the array, without the buffer.
+
+        @param key: Key of a pair.
+        """
+        position = np.searchsorted(self.keys, key)
+        return position < len(self.keys) and self.keys[position] == key
+
+    def contains(self, u, v):
+        """
+        Returns a boolean array telling whether or not each
+        pair (u[k], v[k]) is related.
+
+        @param u: Array of indices of people.
+        @param v: Array of indices of people, same shape as u.
+        """
+        self.compact()
+
+        keys = np.asarray(u, dtype = np.int64) * self.size + np.asarray(v, dtype = np.int64)
+        if len(self.keys) == 0:
+            return np.zeros(keys.shape, dtype = bool)
+
+        # Sorted keys are searched much faster, each search starting
+        # where the one before it ended.
+        order = np.argsort(keys, axis = None)
+        positions = np.empty(keys.size, dtype = np.int64)
+        positions[order] = np.searchsorted(self.keys, keys.ravel()[order])
+        positions = np.minimum(positions, len(self.keys) - 1).reshape(keys.shape)
+
+        return self.keys[positions] == keys
+
+    def related(self, rows):
+        """
+        Returns the people related to each person of rows, as an
+        array with the position in rows of each relation and an
+        array with the person on its other side.
+
+        @param rows: Array of indices of people.
+        """
+        self.compact()
+
+        owners, keys = expandRows(self.keys, np.asarray(rows, dtype = np.int64), self.size)
+        return owners, keys % self.size
+
+    def compact(self):
+        """
+        Merges the buffered changes into the array.
+        """
+        if not self.added and not self.deleted:
+            return
+
+        keys = self.keys
+        if self.deleted:
+            deleted = np.sort(np.fromiter(self.deleted, dtype = np.int64, count = len(self.deleted)))
+            keys = np.delete(keys, np.searchsorted(keys, deleted))
+        if self.added:
+            added = np.sort(np.fromiter(self.added, dtype = np.int64, count = len(self.added)))
+            keys = np.insert(keys, np.searchsorted(keys, added), added)
+
+        self.keys = keys
+        self.added.clear()
+        self.deleted.clear()
+
+    def flush(self):
+        """
+        Merges the buffered changes into the array if there are
+        too many of them.
+        """
+        if len(self.added) + len(self.deleted) > max(self.compact_ratio * len(self.keys), 64):
+            self.compact()
+
+    def setRows(self, indptr, indices):
+        """
+        Replaces every relation with the ones in compressed sparse
+        rows, whose u-th row has everybody related to u.
+
+        @param indptr: Array where row u starts, with one more item at the end.
+        @param indices: Array with the people of every row.
+        """
+        rows = np.repeat(np.arange(len(indptr) - 1, dtype = np.int64), np.diff(indptr))
+        self.keys = np.sort(rows * self.size + np.asarray(indices, dtype = np.int64))
+        self.added.clear()
+        self.deleted.clear()
+
+#-----------------------------------------------------------#
+
+###### EOF: pairsets.py #####################################
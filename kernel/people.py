@@ -0,0 +1,297 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module generates a set of people to be used
+in the module kernel/network.py.
+
+Author: Ivan A. Moreno Soto
+Last updated: 26/March/2018
+"""
+
+#-----------------------------------------------------------#
+
+from collections.abc import Mapping
+
+import numpy as np
+
+import kernel.sources as sources
+
+#-----------------------------------------------------------#
+
+"""
+Global dictionaries for indicating parameters used to create people.
+"""
+active_attr = {'sex':{0:'M', 1:'F'},
+              'orientation':{-1:'straight', 0:'bi', 1:'gay'},
+              'age':{i:i for i in range(16, 30)},
+              'religion':{-2:'atheist', -1:'agnostic', 0:'catholic', 1:'christian', 2:'muslim'},
+              'socio':{-1:'low', 0:'mid', 1:'high'},
+              'race':{-2:'white', -1:'asian', 0:'light-brown', 1:'dark-brown', 2:'afro'},
+              'music':{i:i for i in range(-5, 6)},
+              'hobby':{i:i for i in range(-10, 11)},
+              'personality':{i:i for i in range(-2, 3)}}
+
+# Column of every attribute in the vectors made by attrib2vec.
+attrib_columns = {key:col for (col, key) in enumerate(sorted(active_attr.keys()))}
+
+# Type of the structured arrays where populations keep their attributes.
+attrib_dtype = np.dtype([(key, np.int8) for key in sorted(active_attr.keys())])
+
+#-----------------------------------------------------------#
+
+class AttributeView(Mapping):
+    """
+    This class defines a read-only dictionary with the attributes
+    of a person, taken from a row of the structured array of its
+    population instead of being copied.
+    """
+
+    __slots__ = ('data', 'ident')
+
+    def __init__(self, data, ident):
+        """
+        Creates a view of the attributes of a person.
+
+        @param data: Structured array of attributes with dtype attrib_dtype.
+        @param ident: Row of the person in data.
+        """
+        self.data = data
+        self.ident = ident
+
+    def __getitem__(self, key):
+        return int(self.data[key][self.ident])
+
+    def __iter__(self):
+        return iter(self.data.dtype.names)
+
+    def __len__(self):
+        return len(self.data.dtype.names)
+
+#-----------------------------------------------------------#
+
+class Person:
+    """
+    This class defines a container for the name and
+    attributes of a person. Defines a method to easily
+    obtain a vector of its attributes and to print it.
+    Exes, friends and partners are kept as ids of people.
+    """
+
+    __slots__ = ('ident', 'name', 'attributes', 'exes', 'friends', 'current_partner')
+
+    def __init__(self, name, attrib, ident):
+        """
+        Creates a new person with a given name and attributes.
+
+        @param name: Name of this person.
+        @param attrib: Dictionary of attributes for this person.
+        @param ident: Integer id of this person, its position in its population.
+        """
+        if type(attrib) is not dict and type(attrib) is not AttributeView:
+            raise TypeError("attrib is not a dictionary!")
+
+        self.ident = int(ident)
+        self.name = str(name)
+        self.attributes = attrib
+        self.exes = set()
+        self.friends = set()
+        self.current_partner = None
+
+    def __str__(self):
+        """
+        Returns a string that allows all the information of this
+        person to be printed to some output flow.
+        """
+        attr = ''.join(str(key) + ": " + str(self.attributes[key]) + '\n'
+                       for key in sorted(self.attributes.keys()))
+
+        attr += 'Exes:\n'
+        attr += ''.join(str(ex) + '\n' for ex in sorted(self.exes))
+
+        return "Name: " + self.name + "\n" + attr
+
+#-----------------------------------------------------------#
+
+class Population:
+    """
+    This class defines a population whose attributes are kept
+    as the columns of a structured array. It behaves like a list
+    of Person objects, but each Person is only created the first
+    time it's asked for, with a view of its row as attributes.
+    """
+
+    def __init__(self, names, data):
+        """
+        Creates a population from the names and attributes of its people.
+
+        @param names: List with the name of each person.
+        @param data: Structured array of attributes with dtype attrib_dtype,
+                     with a row for each name.
+        """
+        if len(names) != len(data):
+            raise ValueError("names and data have different lengths!")
+
+        self.names = names
+        self.data = data
+        self.persons = [None] * len(names)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, ident):
+        person = self.persons[ident]
+
+        if person is None:
+            ident = range(len(self.names))[ident]
+            person = Person(self.names[ident], AttributeView(self.data, ident), ident)
+            self.persons[ident] = person
+
+        return person
+
+    def __iter__(self):
+        for ident in range(len(self.names)):
+            yield self[ident]
+
+    def attribMatrix(self):
+        """
+        Returns a matrix with the attributes vector of every person
+        in its rows, as given by attrib2vec.
+        """
+        return np.column_stack([self.data[key] for key in attrib_dtype.names]).astype(float)
+
+#-----------------------------------------------------------#
+
+def attrib2vec(person):
+    """
+    Returns the attributes dictionary of a person as
+    a sorted vector with only the values of each attribute.
+
+    @param person: Person object.
+    """
+    if type(person) is not Person:
+        raise TypeError("person is not a Person object!")
+
+    return [person.attributes[key] for key in sorted(person.attributes.keys())]
+
+#-----------------------------------------------------------#
+
+def attribMatrix(population):
+    """
+    Returns a matrix whose rows are the attribute vectors (as given
+    by attrib2vec) of every person in population.
+
+    @param population: List of Person objects or Population object.
+    """
+    if type(population) is Population:
+        return population.attribMatrix()
+
+    return np.array([attrib2vec(person) for person in population], dtype = float)
+
+#-----------------------------------------------------------#
+
+def readSample(file_path, size, rng):
+    """
+    Reads a file containing rows of names and sexes
+    and samples a set of a given size. Returns a None object
+    if the file fails to be read, otherwise returns a list of
+    tuples.
+
+    @param file_path: Path to the file containing names and sexes.
+    @param size: Size of the sample.
+    @param rng: numpy.random.Generator used to draw the sample.
+    """
+    names = None
+
+    with open(file_path, 'r') as database:
+        rows = database.readlines()
+        database_sample = [rows[k] for k in rng.choice(len(rows), size, replace = False)]
+        names = [tuple(row.split()) for row in database_sample]
+    return names
+
+#-----------------------------------------------------------#
+
+def sampleNames(file_path, size, rng, source = 'file'):
+    """
+    Returns a list of tuples with size names and sexes.
+
+    @param file_path: Path to the file containing names and sexes.
+    @param size: Size of the sample.
+    @param rng: numpy.random.Generator used to draw the sample.
+    @param source: Where the names come from. Options are:
+                   * 'file': readSample, which loads the whole file.
+                   * 'stream': Reservoir sampling of the file.
+                   * 'replace': Sample of the file with replacement.
+                   * 'synthetic': Unique made up names. file_path is ignored.
+    """
+    if source == 'file':
+        return readSample(file_path, size, rng)
+    elif source == 'stream':
+        return sources.streamSample(file_path, size, rng)
+    elif source == 'replace':
+        return sources.sampleWithReplacement(file_path, size, rng)
+    elif source == 'synthetic':
+        return sources.syntheticNames(size, rng)
+    else:
+        raise ValueError("Invalid source!")
+
+#-----------------------------------------------------------#
+
+def makeAttributes(names, rng):
+    """
+    Creates a Population with a person for every name in names
+    with the following attributes:
+    - Sex
+    - Sexual orientation
+    - Age
+    - Religion
+    - Socioeconomic status
+    - Race
+    - Favorite music genre
+    - Favorite hobby
+    - Personality
+    Every attribute but sex is drawn for the whole population at
+    once, uniformly over the values in active_attr. The ids of the
+    people are their positions in names.
+
+    @param names: List of tuples from readSample.
+    @param rng: numpy.random.Generator used to draw the attributes.
+    """
+    if type(names) is not list:
+        raise TypeError("names is not a list!")
+    if len(names) == 0:
+        raise ValueError("names is an empty list!")
+    if type(names[0]) is not tuple:
+        raise TypeError("names is not a list of tuples. Values may be missing!")
+
+    data = np.empty(len(names), dtype = attrib_dtype)
+    data['sex'] = [int(sex) for (name, sex) in names]
+
+    for key in attrib_dtype.names:
+        if key != 'sex':
+            data[key] = rng.integers(min(active_attr[key]), max(active_attr[key]) + 1, len(names))
+
+    return Population([name for (name, sex) in names], data)
+
+#-----------------------------------------------------------#
+
+def createPopulation(file_path, size, rng = None, source = 'file'):
+    """
+    Creates a population of a given size for an artificial social
+    network with names from file_path. Returns a Population object.
+
+    @param file_path: Path of the file with rows of names and sexes.
+    @param size: Size of the population.
+    @param rng: numpy.random.Generator used for every random choice.
+                A new one seeded by the OS is used if None.
+    @param source: Where the names come from (see sampleNames).
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    names = sampleNames(file_path, size, rng, source)
+    population = makeAttributes(names, rng)
+    return population
+
+#-----------------------------------------------------------#
+
+###### EOF: people.py #######################################
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module rebuilds a social network as it was at any
+generation of a simulation, from the nearest keyframe (a
+checkpoint) before it and the events logged after it.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+import numpy as np
+
+import kernel.network as nw
+import kernel.events as events
+import kernel.checkpoint as checkpoint
+from kernel.events import keyframePath, listKeyframes
+
+#-----------------------------------------------------------#
+
+def saveKeyframe(network, dir_path, generation, params = None):
+    """
+    Saves a keyframe of a network next to its event log, writing
+    the buffered events first so the log reaches the keyframe.
+
+    @param network: Network object.
+    @param dir_path: Directory of the event log.
+    @param generation: Number of generations already simulated.
+    @param params: Dictionary with the parameters of the simulation, if any.
+    """
+    if network.events is not None:
+        network.events.flush()
+
+    checkpoint.saveCheckpoint(network, keyframePath(dir_path, generation), generation, params)
+
+#-----------------------------------------------------------#
+
+def applyEvents(network, log):
+    """
+    Applies a sequence of logged events to a network in the same
+    way the simulation did, so the couples and singles end up in
+    the same order.
+
+    @param network: Network object without an event log.
+    @param log: Dictionary with an array for every column of the
+                events (see events.event_columns).
+    """
+    if len(log['type']) == 0:
+        return
+
+    codes = events.event_types
+    types = log['type']
+    a, b = log['a'].astype(np.int64), log['b'].astype(np.int64)
+
+    # Consecutive events of the same type and generation were made
+    # by the same phase of the simulation.
+    changes = (np.diff(types) != 0) | (np.diff(log['generation']) != 0)
+    starts = np.concatenate(([0], np.flatnonzero(changes) + 1))
+    ends = np.append(starts[1:], len(types))
+
+    for (start, end) in zip(starts.tolist(), ends.tolist()):
+        kind = types[start]
+        pairs = np.column_stack((a[start:end], b[start:end])).tolist()
+
+        if kind == codes['create']:
+            for (p, q) in pairs:
+                nw.createRelationship(network, network.people[p], network.people[q])
+            nw.reduceSinglesPool(network)
+        elif kind == codes['delete']:
+            broken = np.zeros(network.n_couples, dtype = bool)
+            broken[network.couple_pos[a[start:end]]] = True
+            nw.deleteRelationships(network, broken)
+        elif kind == codes['friend']:
+            for (p, q) in pairs:
+                nw.makeFriendship(network, network.people[p], network.people[q])
+        elif kind == codes['unfriend']:
+            for (p, q) in pairs:
+                network.people[p].friends.remove(q)
+                network.people[q].friends.remove(p)
+                network.friend_pairs.remove(p, q)
+                network.edges.deleteEdge(p, q, False)
+        else:
+            raise ValueError("Unknown event type: " + str(kind))
+
+    network.edges.flush()
+
+#-----------------------------------------------------------#
+
+def replayNetwork(dir_path, generation):
+    """
+    Returns the Network of a simulation as it was at the end of a
+    generation, loading the nearest keyframe before it and applying
+    the events logged after it. Everything but the state of its
+    random generator is as it was in the simulation.
+
+    @param dir_path: Directory of the event log and its keyframes.
+    @param generation: Generation to rebuild.
+    """
+    if generation > events.lastGeneration(dir_path):
+        raise ValueError("The log doesn't reach generation " + str(generation) + "!")
+
+    keyframes = [k for k in listKeyframes(dir_path) if k <= generation]
+    if not keyframes:
+        raise ValueError("There is no keyframe before generation " + str(generation) + "!")
+
+    network, start, params = checkpoint.loadCheckpoint(keyframePath(dir_path, keyframes[-1]))
+
+    # The log is sorted by generation, so we only read the events between
+    # the keyframe and the generation.
+    log = events.readEvents(dir_path)
+    first, last = np.searchsorted(log['generation'], [start, generation], 'right')
+    if first < last:
+        applyEvents(network, {column:np.array(values[first:last]) for (column, values) in log.items()})
+
+    return network
+
+#-----------------------------------------------------------#
+
+###### EOF: replay.py #######################################
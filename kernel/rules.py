@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module defines the rule sets that tell the simulation
+kernel how a kind of social network behaves: a network of
+lovers, or a network of lovers and friends.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+class RuleSet:
+    """
+    This class defines a container for everything that changes
+    between kinds of social networks: the name of the attribute
+    of their edges, their offsets, parameters and counters, and
+    which phases of the simulation they have.
+    """
+
+    def __init__(self, name, attribute, counter_names, default_offsets, default_params,
+                 friendships, keep_past):
+        """
+        Creates a new rule set.
+
+        @param name: Name of the rule set, a key of rule_sets.
+        @param attribute: Name of the boolean attribute of the edges, True
+                          for current relationships.
+        @param counter_names: Names of the counters of simulation.countNetwork.
+        @param default_offsets: Dictionary with the offsets of the probabilities
+                                of each phase. The ones ending in '_tiers' have
+                                the offset of every angle tier of a pair of people.
+        @param default_params: Dictionary with the default parameters of every
+                               phase of the simulation.
+        @param friendships: Whether or not people make friends. Friendly edges
+                            have False as attribute.
+        @param keep_past: Whether broken relationships keep their edge, with
+                          False as attribute, or lose it.
+        """
+        self.name = name
+        self.attribute = attribute
+        self.counter_names = counter_names
+        self.default_offsets = default_offsets
+        self.default_params = default_params
+        self.friendships = friendships
+        self.keep_past = keep_past
+
+    def __str__(self):
+        """
+        Returns the name of this rule set.
+        """
+        return self.name
+
+#-----------------------------------------------------------#
+
+"""
+Global rule sets of the networks of lovers and of lovers and friends.
+"""
+love_rules = RuleSet('love', 'current', ('singles', 'couples', 'current', 'past'),
+                     {'ex':0.7, # Dating an ex.
+                      'cycle':0.6, # Dating the ex of the partner of an ex.
+                      'romance_tiers':(0, 0.3, 0.4, 0.5, 0.6),
+                      'breakup':0.95, # Probability of a breakup before its tier.
+                      'breakup_tiers':(0.9, 0.9, 0.7, 0.5, 0.3)},
+                     {'sample_pool':20,
+                      'pos_pool':10,
+                      'batched':False,
+                      'offsets':{}},
+                     friendships = False, keep_past = True)
+
+friend_rules = RuleSet('friend', 'romantic', ('singles', 'couples', 'romantic', 'friendly'),
+                       {'friend':0.5, # Dating a friend.
+                        'ex':0.7, # Dating an ex.
+                        'cycle':0.6, # Dating the ex of the partner of an ex.
+                        'romance_tiers':(0, 0.3, 0.4, 0.5, 0.6),
+                        'breakup':0.95, # Probability of a breakup before its tier.
+                        'breakup_tiers':(0.9, 0.9, 0.7, 0.5, 0.3),
+                        'friend_loss':0.9, # Exes that stop being friends.
+                        'friendship_ex':0.9, # Befriending an ex.
+                        'friendship_tiers':(0, 0.3, 0.6, 0.8, 0.9)},
+                       {'sample_pool':20,
+                        'pos_pool':10,
+                        'batched':False,
+                        'sample_size':20,
+                        'pos_size':8,
+                        'friend_limit':6,
+                        'offsets':{}},
+                       friendships = True, keep_past = False)
+
+rule_sets = {rules.name:rules for rules in (love_rules, friend_rules)}
+
+#-----------------------------------------------------------#
+
+###### EOF: rules.py ########################################
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module makes the random number generators used by the
+simulation, so runs can be reproduced from a seed and replicas
+running in parallel get independent streams.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+import random
+
+import numpy as np
+import igraph
+
+#-----------------------------------------------------------#
+
+def makeGenerator(seed = None):
+    """
+    Returns a numpy.random.Generator for a seed. The generator
+    is seeded by the OS if seed is None.
+
+    @param seed: Integer, numpy.random.SeedSequence or None.
+    """
+    return np.random.default_rng(seed)
+
+#-----------------------------------------------------------#
+
+def spawnGenerators(seed, count):
+    """
+    Returns a list of count independent numpy.random.Generator
+    objects spawned from the same seed.
+
+    @param seed: Integer, numpy.random.SeedSequence or None.
+    @param count: Number of generators.
+    """
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+
+    return [np.random.default_rng(child) for child in seed.spawn(count)]
+
+#-----------------------------------------------------------#
+
+def seedGraphs(seed):
+    """
+    Seeds the random numbers of igraph, used by its community
+    detection algorithms, in the current process. igraph keeps a
+    single generator per process, so each process of a pool must
+    seed its own.
+
+    @param seed: Integer or numpy.random.SeedSequence.
+    """
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+
+    igraph.set_random_number_generator(random.Random(int(seed.generate_state(1)[0])))
+
+#-----------------------------------------------------------#
+
+###### EOF: seeding.py ######################################
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module puts together the phases of the simulation of
+a social network so it can be run without any interaction.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+import kernel.network as nw
+
+#-----------------------------------------------------------#
+
+def startSimulation(network, params):
+    """
+    Prepares a network before its first generation: makes the
+    friendships it has before any relationship, if its rule set
+    has friendships.
+
+    @param network: Network object without relationships.
+    @param params: Dictionary with the parameters of the default_params
+                   of the rule set of network.
+    """
+    if network.rules.friendships:
+        nw.computeFriendships(network, params['sample_size'], params['pos_size'],
+                              params['friend_limit'])
+
+#-----------------------------------------------------------#
+
+def simulateGeneration(network, params):
+    """
+    Computes a whole generation of the simulation: new
+    relationships, breakups and, if the rule set of network
+    has them, friendships.
+
+    @param network: Network object.
+    @param params: Dictionary with the parameters of the default_params
+                   of the rule set of network.
+    """
+    if network.events is not None:
+        network.events.nextGeneration()
+
+    nw.computeRomanticRelationships(network, params['sample_pool'], params['pos_pool'],
+                                    params['batched'])
+    nw.computeBreakups(network)
+
+    if network.rules.friendships:
+        nw.computeFriendships(network, params['sample_size'], params['pos_size'],
+                              params['friend_limit'])
+
+#-----------------------------------------------------------#
+
+def countNetwork(network):
+    """
+    Returns a tuple with the counters named in the counter_names
+    of the rule set of network, without going through the graph.
+
+    @param network: Network object.
+    """
+    return (len(network.singles), network.n_couples,
+            network.edges.counts[True], network.edges.counts[False])
+
+#-----------------------------------------------------------#
+
+def truncateCounters(file_path, generation):
+    """
+    Drops every row of a CSV file of counters after a generation,
+    along with a last row that was only partly written. The header
+    and the rows are expected in the order they were written.
+
+    @param file_path: Path of the CSV file, with a header and a row per generation.
+    @param generation: Last generation whose row is kept.
+    """
+    with open(file_path, 'r+b') as counters:
+        counters.readline()
+        keep = counters.tell()
+
+        line = counters.readline()
+        while line.endswith(b'\n') and int(line.split(b',', 1)[0]) <= generation:
+            keep = counters.tell()
+            line = counters.readline()
+
+        counters.truncate(keep)
+
+#-----------------------------------------------------------#
+
+###### EOF: simulation.py ###################################
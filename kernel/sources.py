@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module provides the names and sexes of a population
+without loading a whole database of names into memory, so
+populations can be bigger than the database itself.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+from itertools import islice
+
+import numpy as np
+
+#-----------------------------------------------------------#
+
+def streamSample(file_path, size, rng):
+    """
+    Samples (without replacement) size rows of names and sexes
+    of a file by reading it just once, keeping only size rows in
+    memory (reservoir sampling). Returns a list of tuples in a
+    random order.
+
+    @param file_path: Path to the file containing names and sexes.
+    @param size: Size of the sample.
+    @param rng: numpy.random.Generator used to draw the sample.
+    """
+    with open(file_path, 'r') as database:
+        reservoir = list(islice(database, size))
+        if len(reservoir) < size:
+            raise ValueError("The file has less than " + str(size) + " names!")
+
+        if size > 0:
+            # We jump straight to the next row that enters the reservoir.
+            weight = np.exp(np.log(rng.random()) / size)
+
+            while True:
+                skip = int(np.floor(np.log(rng.random()) / np.log1p(-weight)))
+                row = next(islice(database, skip, skip + 1), None)
+                if row is None:
+                    break
+
+                reservoir[rng.integers(size)] = row
+                weight *= np.exp(np.log(rng.random()) / size)
+
+    return [tuple(reservoir[k].split()) for k in rng.permutation(size)]
+
+#-----------------------------------------------------------#
+
+def sampleWithReplacement(file_path, size, rng):
+    """
+    Samples (with replacement) size rows of names and sexes of a
+    file by reading it twice: once to count its rows and once to
+    pick the sampled ones. Returns a list of tuples in a random
+    order. The population may be bigger than the file.
+
+    @param file_path: Path to the file containing names and sexes.
+    @param size: Size of the sample.
+    @param rng: numpy.random.Generator used to draw the sample.
+    """
+    with open(file_path, 'r') as database:
+        n_rows = sum(1 for row in database)
+    if n_rows == 0:
+        raise ValueError("The file has no names!")
+
+    picked = np.sort(rng.integers(0, n_rows, size))
+    names = []
+
+    with open(file_path, 'r') as database:
+        k = 0
+        for (position, row) in enumerate(database):
+            while k < size and picked[k] == position:
+                names.append(tuple(row.split()))
+                k += 1
+            if k == size:
+                break
+
+    return [names[k] for k in rng.permutation(size)]
+
+#-----------------------------------------------------------#
+
+def syntheticNames(size, rng):
+    """
+    Makes size unique names with random sexes. Returns a list
+    of tuples of names and sexes.
+
+    @param size: Size of the population.
+    @param rng: numpy.random.Generator used to draw the sexes.
+    """
+    sexes = rng.integers(0, 2, size)
+    return [('Person' + str(ident), str(sex)) for (ident, sex) in enumerate(sexes.tolist())]
+
+#-----------------------------------------------------------#
+
+###### EOF: sources.py ######################################
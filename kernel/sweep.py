@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module runs the simulation of a social network over a
+grid of parameters in a pool of processes. The summaries of
+every point of the grid are cached on disk, so running a sweep
+again only simulates the points that weren't finished. The
+sweep.py script of each package runs it from the command line
+with its own rule set.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+import os
+import json
+import hashlib
+import argparse
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import kernel.people as people
+import kernel.seeding as seeding
+import kernel.ensemble as ensemble
+
+#-----------------------------------------------------------#
+
+def expandGrid(grid):
+    """
+    Returns a list with every point of a grid of parameters, as
+    dictionaries from the name of each parameter to its value.
+
+    @param grid: Dictionary from the name of each parameter to a list
+                 of its values. Names are keys of the default_params of a
+                 rule set, or 'offsets.' followed by a key of its default_offsets.
+    """
+    names = sorted(grid.keys())
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+
+#-----------------------------------------------------------#
+
+def makeParams(rules, point):
+    """
+    Returns the parameters of the simulation for a point of a grid,
+    taking the ones it doesn't have from the default_params of rules.
+
+    @param rules: RuleSet object (see kernel.rules).
+    @param point: Dictionary made by expandGrid.
+    """
+    params = dict(rules.default_params, offsets = dict(rules.default_params['offsets']))
+
+    for (name, value) in point.items():
+        if name.startswith('offsets.'):
+            params['offsets'][name[len('offsets.'):]] = value
+        elif name in params:
+            params[name] = value
+        else:
+            raise ValueError("Unknown parameter: " + name)
+
+    return params
+
+#-----------------------------------------------------------#
+
+def pointKey(point, setup):
+    """
+    Returns the name of the cache file of a point of a grid.
+
+    @param point: Dictionary made by expandGrid.
+    @param setup: Dictionary with everything else that changes the
+                  results: population, seed, generations and so on.
+    """
+    description = json.dumps({'point':point, 'setup':setup}, sort_keys = True)
+    return hashlib.sha1(description.encode('utf-8')).hexdigest() + '.npz'
+
+#-----------------------------------------------------------#
+
+def runSweep(rules, file_path, size, grid, generations, seed = 0, replicas = 1, workers = None,
+             cache_dir = 'sweep_cache', community_step = 0, source = 'file'):
+    """
+    Runs replicas of the simulation for every point of a grid of
+    parameters, skipping the points already in the cache. Every
+    point simulates the same population with the same seeds.
+    Returns a list of tuples with each point and an array of shape
+    (replicas, generations, len(ensemble.summaryNames(rules))) with
+    its summaries.
+
+    @param rules: RuleSet object (see kernel.rules).
+    @param file_path: Path of the file with rows of names and sexes.
+    @param size: Size of the population.
+    @param grid: Dictionary from parameters to lists of values (see expandGrid).
+    @param generations: Number of generations to simulate.
+    @param seed: Seed from which every other seed is spawned.
+    @param replicas: Number of replicas of each point.
+    @param workers: Number of processes. Uses every core if None.
+    @param cache_dir: Directory where the summaries of each point are kept.
+    @param community_step: Generations between community stats. 0 disables them.
+    @param source: Where the names come from (see people.sampleNames).
+    """
+    setup = {'rules':rules.name, 'names':os.path.abspath(file_path), 'size':size, 'generations':generations,
+             'seed':seed, 'replicas':replicas, 'community_step':community_step,
+             'source':source}
+    points = expandGrid(grid)
+    paths = [os.path.join(cache_dir, pointKey(point, setup)) for point in points]
+    os.makedirs(cache_dir, exist_ok = True)
+
+    population_seed, *replica_seeds = np.random.SeedSequence(seed).spawn(replicas + 1)
+    names_seed, attributes_seed = population_seed.spawn(2)
+    names = people.sampleNames(file_path, size, seeding.makeGenerator(names_seed), source)
+
+    # Every replica of every missing point is a job of its own.
+    missing = [k for k in range(len(points)) if not os.path.exists(paths[k])]
+
+    with ProcessPoolExecutor(max_workers = workers) as pool:
+        runs = {k:[pool.submit(ensemble.runReplica, rules, names, attributes_seed, replica_seed,
+                               generations, makeParams(rules, points[k]), community_step)
+                   for replica_seed in replica_seeds]
+                for k in missing}
+
+        for k in missing:
+            summaries = np.stack([run.result() for run in runs[k]])
+
+            # We write to a temporary file first so an interrupted sweep
+            # never leaves a broken file in the cache.
+            temporary = paths[k] + '.tmp.npz'
+            np.savez(temporary, summaries = summaries, point = json.dumps(points[k]))
+            os.replace(temporary, paths[k])
+
+    results = []
+    for (point, path) in zip(points, paths):
+        with np.load(path) as cached:
+            results.append((point, cached['summaries']))
+
+    return results
+
+#-----------------------------------------------------------#
+
+def makeParser():
+    """
+    Returns the parser of the command line options.
+    """
+    parser = argparse.ArgumentParser(description = "Parameter sweep of the simulation of social networks.")
+
+    parser.add_argument('grid', help = "JSON file with the grid of parameters.")
+    parser.add_argument('--names', default = 'names.txt', help = "Path of a database of names and sexes.")
+    parser.add_argument('--source', choices = ('file', 'stream', 'replace', 'synthetic'), default = 'file',
+                        help = "Where the names come from (see batch.py).")
+    parser.add_argument('--size', type = int, default = 100, help = "Number of people in the network.")
+    parser.add_argument('--generations', type = int, default = 100, help = "Number of generations to simulate.")
+    parser.add_argument('--seed', type = int, default = 0, help = "Seed of the random numbers.")
+    parser.add_argument('--replicas', type = int, default = 1, help = "Replicas of every point.")
+    parser.add_argument('--workers', type = int, help = "Processes for the sweep. Uses every core by default.")
+    parser.add_argument('--community-step', type = int, default = 0,
+                        help = "Generations between community stats. 0 disables them.")
+    parser.add_argument('--cache', default = 'sweep_cache', help = "Directory where finished points are kept.")
+    parser.add_argument('--output', help = "CSV file where the final stats of every point are written.")
+
+    return parser
+
+#-----------------------------------------------------------#
+
+def main(rules, argv = None):
+    """
+    Runs the sweep asked for in the command line and prints the
+    mean over the replicas of the summary of the last generation
+    of every point. Returns the result of runSweep.
+
+    @param rules: RuleSet object (see kernel.rules).
+    @param argv: List of command line arguments. Uses sys.argv if None.
+    """
+    options = makeParser().parse_args(argv)
+
+    with open(options.grid, 'r') as grid_file:
+        grid = json.load(grid_file)
+
+    results = runSweep(rules, options.names, options.size, grid, options.generations,
+                             options.seed, options.replicas, options.workers,
+                             options.cache, options.community_step, options.source)
+
+    names = sorted(grid.keys())
+    lines = [','.join(names + list(ensemble.summaryNames(rules)))]
+    for (point, summaries) in results:
+        final = ensemble.aggregateSummaries(summaries)['mean'][-1]
+        lines.append(','.join([json.dumps(point[name]) for name in names] +
+                              ['%g' % value for value in final]))
+
+    if options.output is not None:
+        with open(options.output, 'w') as output:
+            output.write(''.join(line + '\n' for line in lines))
+    for line in lines:
+        print(line)
+
+    return results
+
+#-----------------------------------------------------------#
+
+###### EOF: sweep.py ########################################
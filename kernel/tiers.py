@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module caches how compatible people are, measured as the
+tier of the angle between their attributes vectors.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+import math
+import bisect
+
+import numpy as np
+
+#-----------------------------------------------------------#
+
+"""
+Upper bounds of the angle tiers. A pair of people with an angle
+of exactly 0 is in tier 0, an angle in (0, pi/4] is in tier 1,
+and so on until tier 4 for angles bigger than 3*pi/4.
+"""
+tier_bounds = np.array([0, np.pi/4, np.pi/2, 3*np.pi/4])
+
+#-----------------------------------------------------------#
+
+def angleTiers(angles):
+    """
+    Returns the tier of every angle in angles as an array of int8.
+
+    @param angles: Array of angles between attributes vectors.
+    """
+    return np.searchsorted(tier_bounds, angles, side = 'left').astype(np.int8)
+
+#-----------------------------------------------------------#
+
+class TierCache:
+    """
+    This class defines the angle tiers between pairs of people.
+    Tiers are computed straight from the dot product of the two
+    people the first time a pair is asked for. If the tiers of the
+    whole population fit in the memory budget, every tier computed
+    is kept in a matrix, since the same pairs (couples, above all)
+    are asked for generation after generation. Otherwise nothing
+    is kept, as random pairs of a big population are hardly ever
+    asked for twice.
+    """
+
+    def __init__(self, attributes, norms, max_bytes = 64 * 2**20):
+        """
+        Creates an empty cache for the given attribute vectors.
+
+        @param attributes: Matrix with the attributes vector of a person in each row.
+        @param norms: Magnitudes of the rows of attributes.
+        @param max_bytes: Memory budget for the kept tiers.
+        """
+        self.attributes = attributes
+        self.norms = norms
+        self.bounds = tier_bounds.tolist()
+
+        # Tiers are kept plus one, so 0 means the tier isn't known yet.
+        if len(norms)**2 <= max_bytes:
+            self.matrix = np.zeros((len(norms), len(norms)), dtype = np.int8)
+        else:
+            self.matrix = None
+
+    def __len__(self):
+        """
+        Returns the number of pairs whose tier is kept.
+        """
+        if self.matrix is None:
+            return 0
+        return int(np.count_nonzero(self.matrix))
+
+    def computeTier(self, a, b):
+        """
+        Returns the angle tier between two people, without the cache.
+
+        @param a: Index of a Person object.
+        @param b: Index of a Person object.
+        """
+        cosine = float(np.dot(self.attributes[a], self.attributes[b])) / float(self.norms[a] * self.norms[b])
+        return bisect.bisect_left(self.bounds, math.acos(min(max(cosine, -1.0), 1.0)))
+
+    def computeTiers(self, a, b):
+        """
+        Returns the angle tiers between every pair (a[k], b[k]) as an
+        array of int8, without the cache.
+
+        @param a: Array of indices of Person objects.
+        @param b: Array of indices of Person objects, same length as a.
+        """
+        cosines = (np.einsum('ij,ij->i', self.attributes[a], self.attributes[b]) /
+                   (self.norms[a] * self.norms[b]))
+        return angleTiers(np.arccos(np.clip(cosines, -1, 1)))
+
+    def tier(self, a, b):
+        """
+        Returns the angle tier between two people.
+
+        @param a: Index of a Person object.
+        @param b: Index of a Person object.
+        """
+        if self.matrix is None:
+            return self.computeTier(a, b)
+
+        tier = self.matrix[a, b] - 1
+        if tier < 0:
+            tier = self.computeTier(a, b)
+            self.matrix[a, b] = self.matrix[b, a] = tier + 1
+
+        return tier
+
+    def tiers(self, a, b):
+        """
+        Returns the angle tiers between every pair (a[k], b[k]) as an
+        array of int8.
+
+        @param a: Array of indices of Person objects.
+        @param b: Array of indices of Person objects, same length as a.
+        """
+        if self.matrix is None:
+            return self.computeTiers(a, b)
+
+        tiers = self.matrix[a, b] - 1
+        missing = np.flatnonzero(tiers < 0)
+        if len(missing) > 0:
+            tiers[missing] = self.computeTiers(a[missing], b[missing])
+            self.matrix[a[missing], b[missing]] = tiers[missing] + 1
+            self.matrix[b[missing], a[missing]] = tiers[missing] + 1
+
+        return tiers
+
+#-----------------------------------------------------------#
+
+###### EOF: tiers.py ########################################
@@ -0,0 +1,286 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module tracks the community structure of a social network
+across generations, seeding every detection with the communities
+found before so only the places that changed need to settle again.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+import os
+import json
+
+import numpy as np
+
+import kernel.seeding as seeding
+
+#-----------------------------------------------------------#
+
+def edgeKeys(graph):
+    """
+    Returns a sorted array with a key for every pair of people
+    joined by at least one edge of graph.
+
+    @param graph: igraph Graph object.
+    """
+    edges = np.array(graph.get_edgelist(), dtype = np.int64).reshape(-1, 2)
+    edges.sort(axis = 1)
+    return np.unique(edges[:, 0] * graph.vcount() + edges[:, 1])
+
+#-----------------------------------------------------------#
+
+def changedRegion(graph, old_keys, new_keys):
+    """
+    Returns the ids of the people whose edges changed between two
+    sets of edge keys, along with everybody next to them.
+
+    @param graph: igraph Graph object with the new edges.
+    @param old_keys: Array made by edgeKeys before the changes.
+    @param new_keys: Array made by edgeKeys after the changes.
+    """
+    changed = np.setxor1d(old_keys, new_keys, assume_unique = True)
+    touched = np.unique(np.concatenate((changed // graph.vcount(), changed % graph.vcount())))
+    if len(touched) == 0:
+        return touched
+
+    neighborhoods = graph.neighborhood(touched.tolist(), order = 1)
+    return np.unique(np.fromiter((ident for near in neighborhoods for ident in near), dtype = np.int64))
+
+#-----------------------------------------------------------#
+
+def matchCommunities(old, new):
+    """
+    Matches the communities of two membership arrays of the same
+    people, where -1 means no community. Returns a dictionary from
+    each community of new to the one of old it continues (if any),
+    and a dictionary with the births, deaths, merges and splits
+    between them. A community continues another when most of the
+    old one went to it and most of it came from the old one. Every
+    community that doesn't continue or isn't continued is in some
+    change: a new one that most of an old one went to is a merge
+    of it, else one that mostly came from an old one is a split of
+    it, else a birth; an old one is in those merges and splits, or
+    else a death.
+
+    @param old: Array with the community of every person before.
+    @param new: Array with the community of every person after.
+    """
+    old_labels, old_sizes = np.unique(old[old >= 0], return_counts = True)
+    new_labels, new_sizes = np.unique(new[new >= 0], return_counts = True)
+    old_sizes = dict(zip(old_labels.tolist(), old_sizes.tolist()))
+    new_sizes = dict(zip(new_labels.tolist(), new_sizes.tolist()))
+
+    both = (old >= 0) & (new >= 0)
+    pairs, overlaps = np.unique(np.stack((old[both], new[both]), axis = 1), axis = 0, return_counts = True)
+
+    # Where most of each old community went, and where most of each new one came from.
+    successor = {}
+    predecessor = {}
+    for ((a, b), overlap) in zip(pairs.tolist(), overlaps.tolist()):
+        if 2 * overlap > old_sizes[a]:
+            successor[a] = b
+        if 2 * overlap > new_sizes[b]:
+            predecessor[b] = a
+
+    merged = {}
+    for (a, b) in successor.items():
+        merged.setdefault(b, []).append(a)
+    split = {}
+    for (b, a) in predecessor.items():
+        split.setdefault(a, []).append(b)
+
+    continued = {b:a for (b, a) in predecessor.items() if successor.get(a) == b}
+    changes = {'births':[b for b in new_sizes if b not in predecessor and b not in merged],
+               'deaths':[a for a in old_sizes if a not in successor and a not in split],
+               'merges':[(b, sorted(parts)) for (b, parts) in merged.items()
+                         if len(parts) > 1 or b not in continued],
+               'splits':[(a, sorted(parts)) for (a, parts) in split.items()
+                         if len(parts) > 1 or continued.get(parts[0]) != a]}
+
+    return continued, changes
+
+#-----------------------------------------------------------#
+
+class CommunityTracker:
+    """
+    This class defines a tracker of the communities of a network
+    every few generations. Each detection starts from the ones
+    found before: Leiden refines the previous membership, and
+    label propagation only lets the people around changed edges
+    take new labels. Communities keep their label for as long as
+    they continue (see matchCommunities), and people in communities
+    smaller than min_size are in none (-1). igraph is seeded from
+    the seed of the tracker and the generation before every
+    detection, so a resumed simulation finds the same communities.
+    """
+
+    def __init__(self, algorithm = 'leiden', step = 10, min_size = 2, seed = None):
+        """
+        Creates a tracker without any membership yet.
+
+        @param algorithm: 'leiden' or 'label' (label propagation).
+        @param step: Generations between detections.
+        @param min_size: Smallest size of a tracked community.
+        @param seed: Integer seed of the detections. Drawn by the OS if None.
+        """
+        if algorithm not in ('leiden', 'label'):
+            raise ValueError("Invalid option!")
+
+        self.algorithm = algorithm
+        self.step = step
+        self.min_size = min_size
+        self.seed = seed if seed is not None else int(np.random.SeedSequence().entropy % 2**63)
+
+        self.generations = []
+        self.memberships = []
+        self.changes = []
+
+        # Membership found by the algorithm in the last detection, its
+        # edges, and the next label of a new community.
+        self.found = None
+        self.keys = None
+        self.next_label = 0
+
+    def update(self, graph, generation):
+        """
+        Tracks the communities of graph if generation is a multiple
+        of step. Returns whether it did.
+
+        @param graph: igraph Graph object of the network.
+        @param generation: Number of the generation.
+        """
+        if generation % self.step != 0:
+            return False
+
+        self.track(graph, generation)
+        return True
+
+    def detect(self, graph, keys):
+        """
+        Returns the membership found in graph, starting from the
+        last one found if there is one.
+
+        @param graph: igraph Graph object of the network.
+        @param keys: Array with the edge keys of graph (see edgeKeys).
+        """
+        if self.algorithm == 'leiden':
+            clusters = graph.community_leiden(objective_function = 'modularity',
+                                              initial_membership = self.found)
+        elif self.found is None:
+            clusters = graph.community_label_propagation()
+        else:
+            fixed = np.ones(graph.vcount(), dtype = bool)
+            fixed[changedRegion(graph, self.keys, keys)] = False
+            clusters = graph.community_label_propagation(initial = self.found, fixed = fixed.tolist())
+
+        return clusters.membership
+
+    def track(self, graph, generation):
+        """
+        Detects the communities of graph, labels them after the ones
+        they continue and records what changed since the last time.
+
+        @param graph: igraph Graph object of the network.
+        @param generation: Number of the generation.
+        """
+        seeding.seedGraphs(np.random.SeedSequence([self.seed, generation]))
+
+        keys = edgeKeys(graph)
+        self.found = self.detect(graph, keys)
+        self.keys = keys
+
+        found = np.array(self.found, dtype = np.int64)
+        labels, sizes = np.unique(found, return_counts = True)
+        found[np.isin(found, labels[sizes < self.min_size])] = -1
+
+        old = self.memberships[-1] if self.memberships else np.full(len(found), -1, dtype = np.int64)
+        continued, changes = matchCommunities(old, found)
+
+        # Communities that don't continue any other get a new label.
+        relabel = {}
+        for community in np.unique(found[found >= 0]).tolist():
+            if community in continued:
+                relabel[community] = continued[community]
+            else:
+                relabel[community] = self.next_label
+                self.next_label += 1
+
+        membership = np.full(len(found), -1, dtype = np.int64)
+        tracked = found >= 0
+        membership[tracked] = [relabel[community] for community in found[tracked].tolist()]
+
+        self.generations.append(generation)
+        self.memberships.append(membership)
+        self.changes.append({'generation':generation,
+                             'births':[relabel[b] for b in changes['births']],
+                             'deaths':changes['deaths'],
+                             'merges':[(relabel[b], parts) for (b, parts) in changes['merges']],
+                             'splits':[(a, [relabel[b] for b in parts]) for (a, parts) in changes['splits']]})
+
+    def membershipMatrix(self):
+        """
+        Returns an array of shape (detections, people) with the
+        community of every person in each detection.
+        """
+        return np.array(self.memberships, dtype = np.int64).reshape(len(self.memberships), -1)
+
+    def save(self, file_path):
+        """
+        Saves the generations, memberships and changes tracked so
+        far to an .npz file, along with the seed and what the next
+        detection starts from. The file is replaced at once, so an interrupted
+        save keeps the last one.
+
+        @param file_path: Path of the file. Should end with '.npz'.
+        """
+        found = np.array(self.found if self.found is not None else [], dtype = np.int64)
+        keys = self.keys if self.keys is not None else np.zeros(0, dtype = np.int64)
+
+        temporary = file_path + '.tmp.npz'
+        np.savez(temporary, generations = np.array(self.generations, dtype = np.int64),
+                 memberships = self.membershipMatrix(), changes = json.dumps(self.changes),
+                 found = found, keys = keys, next_label = self.next_label, seed = self.seed)
+        os.replace(temporary, file_path)
+
+    def load(self, file_path, generation):
+        """
+        Takes the detections saved before up to a generation, so a
+        resumed simulation keeps tracking after its checkpoint with
+        the same seed. The
+        next detection only starts from the saved membership if no
+        detection was dropped; otherwise it starts from scratch, but
+        its communities are still matched with the last ones kept.
+
+        @param file_path: Path of an .npz file written by save.
+        @param generation: Last generation whose detection is kept.
+        """
+        with np.load(file_path) as saved:
+            generations = saved['generations']
+            memberships = saved['memberships']
+            changes = json.loads(str(saved['changes']))
+            found, keys, next_label = saved['found'], saved['keys'], int(saved['next_label'])
+            seed = int(saved['seed']) if 'seed' in saved.files else None
+
+        kept = int(np.searchsorted(generations, generation, 'right'))
+        self.generations = generations[:kept].tolist()
+        self.memberships = list(memberships[:kept])
+        self.changes = changes[:kept]
+
+        # Labels of dropped detections aren't given again.
+        self.next_label = next_label
+        if seed is not None:
+            self.seed = seed if seed is not None else int(np.random.SeedSequence().entropy % 2**63)
+        if kept == len(generations) and len(found) > 0:
+            self.found = found.tolist()
+            self.keys = keys
+        else:
+            self.found = None
+            self.keys = None
+
+#-----------------------------------------------------------#
+
+###### EOF: tracking.py #####################################
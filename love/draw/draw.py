@@ -52,7 +52,7 @@ def getNodesCoordinates(network, layout):
     coord_fem = [[], [], []]
 
     for v in network.people:
-        k = network.people.index(v)
+        k = v.ident
         
         if v.attributes['sex'] == 0:
             coord_male[0].append(layout[k][0])
@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module runs ensembles of simulations of an affection
+social network with kernel.ensemble.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+import kernel.ensemble as engine
+from kernel.ensemble import *
+from kernel.rules import love_rules as rules
+
+#-----------------------------------------------------------#
+
+# Names of the columns of the summaries made by runReplica.
+summary_names = engine.summaryNames(rules)
+
+#-----------------------------------------------------------#
+
+def runReplica(*args, **kwargs):
+    """
+    Runs a whole simulation (see kernel.ensemble.runReplica).
+    """
+    return engine.runReplica(rules, *args, **kwargs)
+
+#-----------------------------------------------------------#
+
+def runEnsemble(*args, **kwargs):
+    """
+    Runs replicas of the simulation (see kernel.ensemble.runEnsemble).
+    """
+    return engine.runEnsemble(rules, *args, **kwargs)
+
+#-----------------------------------------------------------#
+
+###### EOF: ensemble.py #####################################
@@ -0,0 +1,17 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module exposes kernel.events to the scripts of this
+package.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+from kernel.events import *
+
+#-----------------------------------------------------------#
+
+###### EOF: events.py #######################################
@@ -0,0 +1,17 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module exposes kernel.metrics to the scripts of this
+package.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+from kernel.metrics import *
+
+#-----------------------------------------------------------#
+
+###### EOF: metrics.py ######################################
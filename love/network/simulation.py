@@ -0,0 +1,26 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module runs the simulation of an affection social network
+with kernel.simulation.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+from kernel.simulation import *
+from kernel.rules import love_rules as rules
+
+#-----------------------------------------------------------#
+
+"""
+Global default parameters and names of the counters of the simulation.
+"""
+default_params = rules.default_params
+counter_names = rules.counter_names
+
+#-----------------------------------------------------------#
+
+###### EOF: simulation.py ###################################
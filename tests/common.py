@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module makes small simulations for the tests and takes the
+state of their networks so two of them can be compared.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+import kernel.people as people
+import kernel.network as nw
+import kernel.simulation as sim
+import kernel.seeding as seeding
+
+#-----------------------------------------------------------#
+
+def makeNetwork(rules, size = 120, seed = 1):
+    """
+    Returns a Network of a synthetic population, ready for its
+    first generation, and the parameters of its simulation.
+
+    @param rules: RuleSet object (see kernel.rules).
+    @param size: Number of people.
+    @param seed: Seed of the population and the simulation.
+    """
+    rng = seeding.makeGenerator(seed)
+    network = nw.Network(rules, people.createPopulation(None, size, rng, 'synthetic'), rng)
+    params = dict(rules.default_params)
+    sim.startSimulation(network, params)
+
+    return network, params
+
+#-----------------------------------------------------------#
+
+def networkState(network):
+    """
+    Returns a dictionary with everything that tells the state of a
+    network apart, but its random generator.
+
+    @param network: Network object.
+    """
+    pairs, values = network.edges.edgeList()
+    people_ids = range(len(network.people))
+    network.ex_pairs.compact()
+    network.friend_pairs.compact()
+
+    return {'singles':list(network.singles),
+            'couples':network.couples[:network.n_couples].tolist(),
+            'couple_tiers':network.couple_tiers[:network.n_couples].tolist(),
+            'partners':network.partners.tolist(),
+            'edges':pairs.tolist(),
+            'edge_values':values.tolist(),
+            'counts':dict(network.edges.counts),
+            'exes':[sorted(network.people[ident].exes) for ident in people_ids],
+            'friends':[sorted(network.people[ident].friends) for ident in people_ids],
+            'ex_pairs':network.ex_pairs.keys.tolist(),
+            'friend_pairs':network.friend_pairs.keys.tolist()}
+
+#-----------------------------------------------------------#
+
+def assertSameState(first, second):
+    """
+    Asserts that two networks have the same state (see networkState).
+
+    @param first: Network object.
+    @param second: Network object.
+    """
+    first, second = networkState(first), networkState(second)
+    for key in first:
+        assert first[key] == second[key], key
+
+#-----------------------------------------------------------#
+
+###### EOF: common.py #######################################
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module tests that SparseAdjacency keeps the same edges as
+a plain multiset of them through any sequence of changes.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from kernel.adjacency import SparseAdjacency
+
+#-----------------------------------------------------------#
+
+def referenceList(reference):
+    """
+    Returns a sorted list with every (u, v, value) edge of a
+    multiset of edges, where u < v.
+
+    @param reference: Counter of (u, v, value) edges.
+    """
+    return sorted(reference.elements())
+
+#-----------------------------------------------------------#
+
+def adjacencyList(adjacency):
+    """
+    Returns a sorted list with every (u, v, value) edge of a
+    SparseAdjacency, where u < v.
+
+    @param adjacency: SparseAdjacency object.
+    """
+    pairs, values = adjacency.edgeList()
+    return sorted((u, v, value) for ((u, v), value) in zip(pairs.tolist(), values.tolist()))
+
+#-----------------------------------------------------------#
+
+@pytest.mark.parametrize('seed', range(5))
+def testEdgeListAfterChanges(seed):
+    """
+    Random additions, deletions, changes of attribute and
+    compactions leave the same edges as a multiset.
+    """
+    rng = np.random.default_rng(seed)
+    size = 12
+    adjacency = SparseAdjacency(size, 'value', compact_ratio = 0.1)
+    reference = Counter()
+
+    for step in range(2000):
+        action = rng.choice(('add', 'delete', 'change', 'compact', 'flush'), p = (0.45, 0.3, 0.15, 0.05, 0.05))
+
+        if action == 'add':
+            u, v = rng.choice(size, 2, replace = False).tolist()
+            value = bool(rng.integers(2))
+            adjacency.addEdge(u, v, value)
+            reference[(min(u, v), max(u, v), value)] += 1
+        elif action in ('delete', 'change') and reference:
+            edges = sorted(reference)
+            (u, v, value) = edges[rng.integers(len(edges))]
+            # Either end may be given first.
+            if rng.integers(2):
+                u, v = v, u
+
+            if action == 'delete':
+                adjacency.deleteEdge(u, v, value)
+            else:
+                adjacency.changeEdge(u, v, value, not value)
+                reference[(min(u, v), max(u, v), not value)] += 1
+
+            reference[(min(u, v), max(u, v), value)] -= 1
+            reference += Counter() # Drops the edges counted 0 times.
+        elif action == 'compact':
+            adjacency.compact()
+        elif action == 'flush':
+            adjacency.flush()
+
+        if step % 50 == 0:
+            assert adjacencyList(adjacency) == referenceList(reference)
+
+    assert adjacencyList(adjacency) == referenceList(reference)
+    assert adjacency.counts[True] == sum(n for ((u, v, value), n) in reference.items() if value)
+    assert adjacency.counts[False] == sum(n for ((u, v, value), n) in reference.items() if not value)
+
+    for ((u, v, value), n) in reference.items():
+        assert adjacency.multiplicity(u, v, value) == n
+        assert adjacency.multiplicity(v, u, value) == n
+
+    adjacency.compact()
+    assert adjacencyList(adjacency) == referenceList(reference)
+    for u in range(size):
+        expected = sorted(v for ((a, b, value), n) in reference.items() for v in [b if a == u else a] * n
+                          if u in (a, b))
+        assert adjacency.neighbors(u).tolist() == expected
+
+#-----------------------------------------------------------#
+
+def testDeleteMissingEdge():
+    """
+    Deleting an edge that isn't there raises a ValueError, and
+    loops can't be added.
+    """
+    adjacency = SparseAdjacency(4, 'value')
+    adjacency.addEdge(0, 1, True)
+    adjacency.compact()
+
+    with pytest.raises(ValueError):
+        adjacency.deleteEdge(0, 1, False)
+    with pytest.raises(ValueError):
+        adjacency.deleteEdge(2, 3, True)
+    with pytest.raises(ValueError):
+        adjacency.addEdge(2, 2, True)
+
+    adjacency.deleteEdge(1, 0, True)
+    with pytest.raises(ValueError):
+        adjacency.deleteEdge(0, 1, True)
+
+#-----------------------------------------------------------#
+
+###### EOF: test_adjacency.py ###############################
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module tests the community structures returned by the
+analysis of a network.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+import igraph
+import pytest
+
+from kernel.analysis import Communities, CommunityView, algorithms, runtime_models, auto_order, chooseAlgorithm
+
+#-----------------------------------------------------------#
+
+def testCommunities():
+    """
+    Communities index, slice and iterate like a sequence of views
+    with the vertices and inner edges of every community.
+    """
+    graph = igraph.Graph(n = 7, edges = [(0, 1), (1, 2), (2, 0), (3, 4), (4, 5), (2, 3), (5, 6)])
+    communities = Communities(graph, [0, 0, 0, 1, 1, 1, 2])
+
+    assert len(communities) == 3
+    assert [community.vertices().tolist() for community in communities] == [[0, 1, 2], [3, 4, 5], [6]]
+    assert communities[-1].vertices().tolist() == [6]
+    assert sorted(map(sorted, communities[0].edges().tolist())) == [[0, 1], [0, 2], [1, 2]]
+    assert communities[1].subgraph().ecount() == 2
+    assert communities[2].edges().shape == (0, 2)
+
+    sliced = communities[1:3]
+    assert all(isinstance(community, CommunityView) for community in sliced)
+    assert [len(community) for community in sliced] == [3, 1]
+    assert [community.index for community in communities[::-2]] == [2, 0]
+    assert communities[5:] == []
+
+    with pytest.raises(IndexError):
+        communities[3]
+
+#-----------------------------------------------------------#
+
+class SizedGraph:
+    """
+    This class defines a stand-in for a graph of any size, with
+    only the counts chooseAlgorithm looks at.
+    """
+
+    def __init__(self, n, m):
+        self.n = n
+        self.m = m
+
+    def vcount(self):
+        return self.n
+
+    def ecount(self):
+        return self.m
+
+#-----------------------------------------------------------#
+
+def testChooseAlgorithm():
+    """
+    'auto' picks an algorithm of auto_order that fits the budget
+    whenever one does, and the one with the lowest estimated
+    runtime otherwise. Every algorithm of auto_order is picked
+    somewhere.
+    """
+    assert set(runtime_models) == set(algorithms)
+    assert set(auto_order) <= set(algorithms)
+
+    chosen = set()
+    for n in (10, 100, 10**3, 10**4, 10**5, 10**6, 10**7, 10**8):
+        for degree in (1, 3, 10):
+            for budget in (1e-4, 1e-3, 0.01, 0.1, 1, 10, 60, 600, 3600):
+                graph = SizedGraph(n, n * degree // 2)
+                algorithm = chooseAlgorithm(graph, budget)
+                estimate = runtime_models[algorithm](graph.n, graph.m)
+                chosen.add(algorithm)
+
+                fitting = [name for name in auto_order if runtime_models[name](graph.n, graph.m) <= budget]
+                if fitting:
+                    assert algorithm == fitting[0]
+                    assert estimate <= budget
+                else:
+                    assert estimate == min(model(graph.n, graph.m) for model in runtime_models.values())
+
+    assert set(auto_order) <= chosen
+
+#-----------------------------------------------------------#
+
+def testChooseAlgorithmRuns():
+    """
+    The algorithm picked for a real graph runs on it.
+    """
+    graph = igraph.Graph.Famous('Zachary')
+    algorithm = chooseAlgorithm(graph)
+    assert algorithm in auto_order
+    assert len(set(algorithms[algorithm](graph).membership)) > 1
+
+#-----------------------------------------------------------#
+
+###### EOF: test_analysis.py ################################
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module tests that a simulation resumed from a checkpoint
+goes on exactly as if it had never stopped.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+import os
+import sys
+import subprocess
+
+import numpy as np
+import pytest
+
+import kernel.simulation as sim
+import kernel.checkpoint as checkpoint
+from kernel.rules import love_rules, friend_rules
+
+from common import makeNetwork, assertSameState
+
+#-----------------------------------------------------------#
+
+"""
+Root of the repository, where the directories of the packages are.
+"""
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+#-----------------------------------------------------------#
+
+@pytest.mark.parametrize('rules', (love_rules, friend_rules), ids = lambda rules: rules.name)
+@pytest.mark.parametrize('batched', (False, True), ids = ('scalar', 'batched'))
+def testResumedCounters(rules, batched, tmp_path):
+    """
+    A run saved and resumed halfway has the same counters in every
+    generation, and the same final network, as an uninterrupted one.
+    """
+    generations, stop = 30, 13
+    file_path = str(tmp_path / 'state.npz')
+
+    network, params = makeNetwork(rules, seed = 5)
+    params['batched'] = batched
+    uninterrupted = []
+    for generation in range(1, generations + 1):
+        sim.simulateGeneration(network, params)
+        uninterrupted.append(sim.countNetwork(network))
+
+    stopped, params = makeNetwork(rules, seed = 5)
+    params['batched'] = batched
+    resumed = []
+    for generation in range(1, stop + 1):
+        sim.simulateGeneration(stopped, params)
+        resumed.append(sim.countNetwork(stopped))
+    checkpoint.saveCheckpoint(stopped, file_path, stop, params)
+
+    loaded, start, params = checkpoint.loadCheckpoint(file_path)
+    assert start == stop
+    assert loaded.rules is rules
+    assertSameState(loaded, stopped)
+
+    for generation in range(start + 1, generations + 1):
+        sim.simulateGeneration(loaded, params)
+        resumed.append(sim.countNetwork(loaded))
+
+    assert resumed == uninterrupted
+    assertSameState(loaded, network)
+
+#-----------------------------------------------------------#
+
+def runBatch(package, *options):
+    """
+    Runs the batch.py script of a package with some options.
+
+    @param package: 'love' or 'friend'.
+    @param options: Command line options.
+    """
+    subprocess.run([sys.executable, 'batch.py', '--quiet', '--source', 'synthetic', *options],
+                   cwd = os.path.join(root, package), check = True)
+
+#-----------------------------------------------------------#
+
+@pytest.mark.parametrize('package', ('love', 'friend'))
+def testResumedCountersFile(package, tmp_path):
+    """
+    batch.py resumed from a checkpoint writes the same counters
+    file as an uninterrupted run, even if the stopped run wrote
+    rows after its checkpoint.
+    """
+    whole, parts = str(tmp_path / 'whole.csv'), str(tmp_path / 'parts.csv')
+    state = str(tmp_path / 'state.npz')
+
+    runBatch(package, '--size', '80', '--seed', '2', '--generations', '40', '--counters', whole)
+    runBatch(package, '--size', '80', '--seed', '2', '--generations', '25', '--counters', parts,
+             '--checkpoint', state)
+
+    # Rows of a run that went on after its checkpoint and stopped
+    # in the middle of a row.
+    with open(parts, 'a') as counters:
+        counters.write('26,0,0,0,0\n27,0,0,0,0\n28,1,')
+
+    runBatch(package, '--generations', '40', '--counters', parts, '--resume', state)
+
+    with open(whole, 'r') as expected, open(parts, 'r') as written:
+        assert written.read() == expected.read()
+
+#-----------------------------------------------------------#
+
+@pytest.mark.parametrize('algorithm', ('leiden', 'label'))
+def testResumedTracking(algorithm, tmp_path):
+    """
+    batch.py resumed from a checkpoint tracks the same communities
+    as an uninterrupted run, with the same changes between them.
+    """
+    whole, parts = str(tmp_path / 'whole.npz'), str(tmp_path / 'parts.npz')
+    state = str(tmp_path / 'state.npz')
+    tracking = ('--track-algorithm', algorithm, '--track-step', '10')
+
+    runBatch('friend', '--size', '120', '--seed', '4', '--generations', '60', '--track', whole, *tracking)
+    runBatch('friend', '--size', '120', '--seed', '4', '--generations', '30', '--track', parts,
+             '--checkpoint', state, *tracking)
+    runBatch('friend', '--generations', '60', '--track', parts, '--resume', state, *tracking)
+
+    with np.load(whole) as expected, np.load(parts) as written:
+        assert written['generations'].tolist() == expected['generations'].tolist() == [10, 20, 30, 40, 50, 60]
+        assert np.array_equal(written['memberships'], expected['memberships'])
+        assert str(written['changes']) == str(expected['changes'])
+
+#-----------------------------------------------------------#
+
+###### EOF: test_checkpoint.py ##############################
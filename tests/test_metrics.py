@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module tests that the metrics kept up to date as edges
+change are the same as the ones computed from the whole graph.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+import math
+
+import numpy as np
+import pytest
+
+import kernel.simulation as sim
+from kernel.metrics import MetricsCollector, metrics_dtype
+from kernel.rules import love_rules, friend_rules
+
+from common import makeNetwork
+
+#-----------------------------------------------------------#
+
+def graphMetrics(network, degree_bins):
+    """
+    Returns a dictionary with the metrics of a network computed
+    from its simple graph with igraph, and its degree distribution.
+
+    @param network: Network object.
+    @param degree_bins: Bins of the degree distribution.
+    """
+    simple = network.graph.copy()
+    simple.simplify()
+    degrees = np.array(simple.degree(), dtype = np.int64)
+
+    return {'pairs':simple.ecount(),
+            'max_degree':int(degrees.max()),
+            'mean_degree':2 * simple.ecount() / simple.vcount(),
+            'triangles':len(simple.list_triangles()),
+            'transitivity':simple.transitivity_undirected(),
+            'components':len(simple.connected_components()),
+            'singles_fraction':len(network.singles) / simple.vcount()}, \
+           np.bincount(np.minimum(degrees, degree_bins - 1), minlength = degree_bins)
+
+#-----------------------------------------------------------#
+
+@pytest.mark.parametrize('rules', (love_rules, friend_rules), ids = lambda rules: rules.name)
+@pytest.mark.parametrize('recompute_step', (1, 4))
+def testRecordedMetrics(rules, recompute_step):
+    """
+    Every recorded row has the pairs, degrees, triangles,
+    transitivity and components of the simple graph of the
+    network. Components are either right or unknown (-1), and
+    known every recompute_step generations.
+    """
+    network, params = makeNetwork(rules, size = 150, seed = 6)
+    collector = MetricsCollector(network, recompute_step, degree_bins = 6)
+
+    generations = 40
+    expected = []
+    for generation in range(1, generations + 1):
+        sim.simulateGeneration(network, params)
+        collector.record(generation)
+        expected.append(graphMetrics(network, collector.degree_bins))
+    collector.close()
+    assert network.edges.watcher is None
+
+    table, degrees = collector.table()
+    assert table.dtype == metrics_dtype
+    assert table['generation'].tolist() == list(range(1, generations + 1))
+
+    for (row, histogram, (metrics, distribution)) in zip(table, degrees, expected):
+        assert row['pairs'] == metrics['pairs']
+        assert row['max_degree'] == metrics['max_degree']
+        assert row['triangles'] == metrics['triangles']
+        assert math.isclose(row['mean_degree'], metrics['mean_degree'], rel_tol = 1e-6)
+        assert math.isclose(row['singles_fraction'], metrics['singles_fraction'], rel_tol = 1e-6)
+        if math.isnan(metrics['transitivity']):
+            assert math.isnan(row['transitivity'])
+        else:
+            assert math.isclose(row['transitivity'], metrics['transitivity'], rel_tol = 1e-5)
+
+        assert row['components'] in (-1, metrics['components'])
+        if row['generation'] % recompute_step == 0:
+            assert row['components'] == metrics['components']
+
+        assert histogram.tolist() == distribution.tolist()
+
+    counts = network.edges.counts
+    assert math.isclose(table['false_true_ratio'][-1], counts[False] / counts[True], rel_tol = 1e-6)
+
+#-----------------------------------------------------------#
+
+def testSavedTable(tmp_path):
+    """
+    A saved table is loaded back up to a generation.
+    """
+    file_path = str(tmp_path / 'metrics.npz')
+    network, params = makeNetwork(friend_rules, seed = 2)
+    collector = MetricsCollector(network)
+    for generation in range(1, 11):
+        sim.simulateGeneration(network, params)
+        collector.record(generation)
+    collector.save(file_path)
+
+    table, degrees = collector.table()
+    loaded = MetricsCollector(network)
+    loaded.load(file_path, 6)
+    loaded_table, loaded_degrees = loaded.table()
+
+    assert loaded_table.tolist() == table[:6].tolist()
+    assert np.array_equal(loaded_degrees, degrees[:6])
+
+#-----------------------------------------------------------#
+
+###### EOF: test_metrics.py #################################
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module tests that the batched lookups of the simulation
+give the same answers as the sets of every person, and that
+batched generations keep the couples consistent.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+import numpy as np
+import pytest
+
+import kernel.simulation as sim
+from kernel.cycles import countCycles, countCyclePairs
+from kernel.rules import love_rules, friend_rules
+
+from common import makeNetwork
+
+#-----------------------------------------------------------#
+
+def assertConsistentCouples(network):
+    """
+    Asserts that nobody has two partners: every couple is in
+    in_relation once, partners point at each other, and the
+    singles are the people without a partner. The tier kept
+    for every couple must be its angle tier.
+
+    @param network: Network object.
+    """
+    couples = network.in_relation
+    people_in_couples = couples.ravel()
+    assert len(np.unique(people_in_couples)) == len(people_in_couples)
+
+    assert np.array_equal(network.partners[couples[:, 0]], couples[:, 1])
+    assert np.array_equal(network.partners[couples[:, 1]], couples[:, 0])
+    assert np.count_nonzero(network.partners >= 0) == len(people_in_couples)
+    assert np.array_equal(network.couple_pos[couples[:, 0]], np.arange(len(couples)))
+
+    paired = network.partners[network.partners >= 0]
+    assert np.array_equal(network.partners[paired], np.flatnonzero(network.partners >= 0))
+    assert sorted(network.singles) == np.flatnonzero(network.partners < 0).tolist()
+    for (p, q) in couples.tolist():
+        assert network.people[p].current_partner == q
+
+    tiers = network.tiers.computeTiers(couples[:, 0], couples[:, 1])
+    assert np.array_equal(network.couple_tiers[:network.n_couples], tiers)
+
+#-----------------------------------------------------------#
+
+def samplePairs(network, rng, count):
+    """
+    Returns an array of shape (pairs, 2) with random pairs of
+    people, along with the pairs that close a cycle of exes and
+    the pairs of exes and of friends.
+
+    @param network: Network object.
+    @param rng: numpy.random.Generator.
+    @param count: Number of random pairs.
+    """
+    size = len(network.people)
+    pairs = [rng.integers(size, size = 2).tolist() for k in range(count)]
+
+    for a in range(size):
+        person = network.people[a]
+        pairs += [[a, ex] for ex in person.exes] + [[a, friend] for friend in person.friends]
+
+        # a and q make a cycle when q is an ex of the partner of an ex of a.
+        for ex in person.exes:
+            partner = network.partners[ex]
+            if partner >= 0:
+                pairs += [[a, q] for q in network.people[partner].exes if q != a]
+
+    return np.array(pairs, dtype = np.int64).reshape(-1, 2)
+
+#-----------------------------------------------------------#
+
+@pytest.mark.parametrize('rules', (love_rules, friend_rules), ids = lambda rules: rules.name)
+def testBatchedLookups(rules):
+    """
+    After many batched generations, the cycles, exes and friends
+    of many pairs looked up at once are the ones of the sets of
+    every person, and nobody ever has two partners.
+    """
+    network, params = makeNetwork(rules, size = 200, seed = 9)
+    params = dict(params, batched = True, sample_pool = 60)
+    rng = np.random.default_rng(1)
+
+    for generation in range(1, 121):
+        sim.simulateGeneration(network, params)
+        assertConsistentCouples(network)
+
+        if generation % 30 == 0:
+            pairs = samplePairs(network, rng, 2000)
+            a, b = pairs[:, 0], pairs[:, 1]
+
+            cycles = countCyclePairs(network, pairs)
+            assert cycles.tolist() == [countCycles(network, p, q) for (p, q) in pairs.tolist()]
+
+            exes = network.ex_pairs.contains(a, b)
+            assert exes.tolist() == [q in network.people[p].exes for (p, q) in pairs.tolist()]
+
+            friends = network.friend_pairs.contains(a, b)
+            assert friends.tolist() == [q in network.people[p].friends for (p, q) in pairs.tolist()]
+
+    # The pairs above looked up something of every kind.
+    assert cycles.max() > 0 and exes.any()
+    assert friends.any() == rules.friendships
+
+#-----------------------------------------------------------#
+
+###### EOF: test_network.py #################################
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module tests that networks rebuilt from keyframes and the
+event log are the same as the ones of the simulation that
+logged them.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+import pytest
+
+import kernel.simulation as sim
+import kernel.events as events
+import kernel.replay as replay
+import kernel.checkpoint as checkpoint
+from kernel.rules import love_rules, friend_rules
+
+from common import makeNetwork, assertSameState
+
+#-----------------------------------------------------------#
+
+@pytest.mark.parametrize('rules', (love_rules, friend_rules), ids = lambda rules: rules.name)
+def testReplayMatchesLiveRun(rules, tmp_path):
+    """
+    The last generation rebuilt by replayNetwork, from its nearest
+    keyframe and the events after it, has the same state as the
+    live network.
+    """
+    log_path = str(tmp_path / 'events')
+    network, params = makeNetwork(rules, seed = 3)
+    network.events = events.EventLog(log_path)
+    replay.saveKeyframe(network, log_path, 0, params)
+
+    for generation in range(1, 25):
+        sim.simulateGeneration(network, params)
+        if generation % 10 == 0:
+            replay.saveKeyframe(network, log_path, generation, params)
+    network.events.close()
+
+    assert replay.listKeyframes(log_path) == [0, 10, 20]
+    assertSameState(replay.replayNetwork(log_path, 24), network)
+
+#-----------------------------------------------------------#
+
+@pytest.mark.parametrize('rules', (love_rules, friend_rules), ids = lambda rules: rules.name)
+def testReplayEveryGeneration(rules, tmp_path):
+    """
+    The network of every generation is rebuilt with the same
+    state as a live run, checked generation by generation against
+    a second run with the same seed.
+    """
+    log_path = str(tmp_path / 'events')
+    logged, params = makeNetwork(rules, seed = 8)
+    logged.events = events.EventLog(log_path)
+    replay.saveKeyframe(logged, log_path, 0, params)
+
+    generations = 15
+    for generation in range(1, generations + 1):
+        sim.simulateGeneration(logged, params)
+        if generation % 7 == 0:
+            replay.saveKeyframe(logged, log_path, generation, params)
+    logged.events.close()
+
+    live, params = makeNetwork(rules, seed = 8)
+    for generation in range(1, generations + 1):
+        sim.simulateGeneration(live, params)
+        assertSameState(replay.replayNetwork(log_path, generation), live)
+
+#-----------------------------------------------------------#
+
+def runLogged(rules, log_path, seed, generations, keyframe_step = 0, start = None):
+    """
+    Runs a simulation that logs its events to a directory, and
+    returns its Network. A resumed run continues the network saved
+    in the keyframe of generation start.
+
+    @param rules: RuleSet object (see kernel.rules).
+    @param log_path: Directory of the event log.
+    @param seed: Seed of the population and the simulation.
+    @param generations: Last generation to simulate.
+    @param keyframe_step: Generations between keyframes. 0 disables them.
+    @param start: Generation of the keyframe to resume from, if any.
+    """
+    if start is None:
+        network, params = makeNetwork(rules, seed = seed)
+        network.events = events.EventLog(log_path)
+        start = 0
+        if keyframe_step > 0:
+            replay.saveKeyframe(network, log_path, 0, params)
+    else:
+        network, start, params = checkpoint.loadCheckpoint(replay.keyframePath(log_path, start))
+        network.events = events.EventLog(log_path, start)
+
+    for generation in range(start + 1, generations + 1):
+        sim.simulateGeneration(network, params)
+        if keyframe_step > 0 and generation % keyframe_step == 0:
+            replay.saveKeyframe(network, log_path, generation, params)
+    network.events.close()
+
+    return network
+
+#-----------------------------------------------------------#
+
+def testReusedDirectory(tmp_path):
+    """
+    A new run in the directory of an older log drops the keyframes
+    of the older run, so they are never mixed with the new events,
+    and generations after the new log can't be rebuilt.
+    """
+    log_path = str(tmp_path / 'events')
+    runLogged(love_rules, log_path, 1, 30, keyframe_step = 10)
+    assert replay.listKeyframes(log_path) == [0, 10, 20, 30]
+
+    runLogged(love_rules, log_path, 2, 20)
+    assert replay.listKeyframes(log_path) == []
+    assert events.lastGeneration(log_path) == 20
+    with pytest.raises(ValueError):
+        replay.replayNetwork(log_path, 15)
+
+    network = runLogged(love_rules, log_path, 2, 20, keyframe_step = 10)
+    assertSameState(replay.replayNetwork(log_path, 20), network)
+    with pytest.raises(ValueError):
+        replay.replayNetwork(log_path, 25)
+
+#-----------------------------------------------------------#
+
+def testResumedLog(tmp_path):
+    """
+    A run resumed from a keyframe drops the events and keyframes
+    after it, and its log rebuilds the same networks as a run that
+    never stopped.
+    """
+    log_path = str(tmp_path / 'events')
+    runLogged(friend_rules, log_path, 4, 26, keyframe_step = 5)
+    network = runLogged(friend_rules, log_path, 4, 22, keyframe_step = 5, start = 10)
+    assert replay.listKeyframes(log_path) == [0, 5, 10, 15, 20]
+    assert events.lastGeneration(log_path) == 22
+
+    live, params = makeNetwork(friend_rules, seed = 4)
+    for generation in range(1, 23):
+        sim.simulateGeneration(live, params)
+        if generation % 4 == 0:
+            assertSameState(replay.replayNetwork(log_path, generation), live)
+    assertSameState(network, live)
+
+#-----------------------------------------------------------#
+
+def testReplayBeforeKeyframes(tmp_path):
+    """
+    A generation before every keyframe can't be rebuilt.
+    """
+    log_path = str(tmp_path / 'events')
+    network, params = makeNetwork(love_rules)
+    network.events = events.EventLog(log_path)
+    sim.simulateGeneration(network, params)
+    replay.saveKeyframe(network, log_path, 1, params)
+    network.events.close()
+
+    with pytest.raises(ValueError):
+        replay.replayNetwork(log_path, 0)
+
+#-----------------------------------------------------------#
+
+###### EOF: test_replay.py ##################################
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module tests how communities are matched between two
+detections, and how a tracker is saved and loaded back.
+
+Author: Ivan A. Moreno Soto
+Last updated: 18/October/2026
+"""
+
+#-----------------------------------------------------------#
+
+import json
+
+import igraph
+import numpy as np
+
+from kernel.tracking import matchCommunities, CommunityTracker
+
+#-----------------------------------------------------------#
+
+def match(old, new):
+    """
+    Returns matchCommunities for two lists of communities.
+
+    @param old: List with the community of every person before.
+    @param new: List with the community of every person after.
+    """
+    return matchCommunities(np.array(old, dtype = np.int64), np.array(new, dtype = np.int64))
+
+#-----------------------------------------------------------#
+
+def testContinued():
+    """
+    Communities that keep most of their people continue, without
+    any change.
+    """
+    continued, changes = match([0, 0, 0, 1, 1, 1, -1], [5, 5, 5, 7, 7, 7, 7])
+    assert continued == {5:0, 7:1}
+    assert changes == {'births':[], 'deaths':[], 'merges':[], 'splits':[]}
+
+#-----------------------------------------------------------#
+
+def testBirth():
+    """
+    A community of people that were in none is born.
+    """
+    continued, changes = match([0, 0, 0, -1, -1, -1], [0, 0, 0, 1, 1, 1])
+    assert continued == {0:0}
+    assert changes == {'births':[1], 'deaths':[], 'merges':[], 'splits':[]}
+
+#-----------------------------------------------------------#
+
+def testDeath():
+    """
+    A community whose people end up in none dies.
+    """
+    continued, changes = match([0, 0, 0, 1, 1, 1], [0, 0, 0, -1, -1, -1])
+    assert continued == {0:0}
+    assert changes == {'births':[], 'deaths':[1], 'merges':[], 'splits':[]}
+
+#-----------------------------------------------------------#
+
+def testMerge():
+    """
+    Two communities that end up together merge, and so does one
+    that most of an old one went to without continuing it.
+    """
+    continued, changes = match([0, 0, 0, 1, 1, 1], [2, 2, 2, 2, 2, 2])
+    assert continued == {}
+    assert changes == {'births':[], 'deaths':[], 'merges':[(2, [0, 1])], 'splits':[]}
+
+    continued, changes = match([0, 0, 0, -1, -1, -1, -1], [4, 4, 4, 4, 4, 4, 4])
+    assert continued == {}
+    assert changes == {'births':[], 'deaths':[], 'merges':[(4, [0])], 'splits':[]}
+
+#-----------------------------------------------------------#
+
+def testSplit():
+    """
+    A community whose people end up in two halves splits, and so
+    does one that a new community mostly came from while most of
+    it went to another one.
+    """
+    continued, changes = match([0, 0, 0, 0, 0, 0], [1, 1, 1, 2, 2, 2])
+    assert continued == {}
+    assert changes == {'births':[], 'deaths':[], 'merges':[], 'splits':[(0, [1, 2])]}
+
+    # Most of 0 and all of 1 merge into 2, while the rest of 0 is 3.
+    continued, changes = match([0, 0, 0, 0, 0, 0, 1, 1, 1, 1], [2, 2, 2, 2, 3, 3, 2, 2, 2, 2])
+    assert continued == {}
+    assert changes == {'births':[], 'deaths':[], 'merges':[(2, [0, 1])], 'splits':[(0, [3])]}
+
+#-----------------------------------------------------------#
+
+def testEveryLabelHasAnEvent():
+    """
+    Every community that appears or disappears between random
+    memberships is in some change.
+    """
+    rng = np.random.default_rng(0)
+    for trial in range(300):
+        old = rng.integers(-1, 5, 30)
+        new = np.where(rng.random(30) < 0.6, old, rng.integers(-1, 5, 30))
+        continued, changes = matchCommunities(old, new)
+
+        appeared = set(new[new >= 0].tolist()) - set(continued)
+        vanished = set(old[old >= 0].tolist()) - set(continued.values())
+        assert appeared <= (set(changes['births']) | {b for (b, parts) in changes['merges']} |
+                            {b for (a, parts) in changes['splits'] for b in parts})
+        assert vanished <= (set(changes['deaths']) | {a for (b, parts) in changes['merges'] for a in parts} |
+                            {a for (a, parts) in changes['splits']})
+
+#-----------------------------------------------------------#
+
+def testSaveAndLoad(tmp_path):
+    """
+    A loaded tracker has the detections saved up to a generation,
+    and goes on with the same communities as the saved one.
+    """
+    file_path = str(tmp_path / 'communities.npz')
+    graph = igraph.Graph.Famous('Zachary')
+
+    tracker = CommunityTracker('leiden', step = 10, seed = 3)
+    tracker.update(graph, 10)
+    graph.delete_edges([(0, 1), (32, 33)])
+    tracker.update(graph, 20)
+    tracker.save(file_path)
+
+    loaded = CommunityTracker('leiden', step = 10)
+    loaded.load(file_path, 20)
+    assert loaded.seed == 3
+    assert loaded.generations == [10, 20]
+    assert np.array_equal(loaded.membershipMatrix(), tracker.membershipMatrix())
+    assert loaded.changes == json.loads(json.dumps(tracker.changes))
+    assert loaded.found == tracker.found
+    assert np.array_equal(loaded.keys, tracker.keys)
+    assert loaded.next_label == tracker.next_label
+
+    graph.add_edges([(0, 33), (5, 16)])
+    tracker.update(graph, 30)
+    loaded.update(graph, 30)
+    assert np.array_equal(loaded.membershipMatrix(), tracker.membershipMatrix())
+    assert json.dumps(loaded.changes) == json.dumps(tracker.changes)
+
+    # Going back drops the later detections and where they started from.
+    earlier = CommunityTracker('leiden', step = 10)
+    earlier.load(file_path, 15)
+    assert earlier.generations == [10]
+    assert np.array_equal(earlier.membershipMatrix(), tracker.membershipMatrix()[:1])
+    assert earlier.found is None
+
+#-----------------------------------------------------------#
+
+###### EOF: test_tracking.py ################################